@@ -1,7 +1,8 @@
 import argparse
+import math
 from typing import Any, List, Tuple
 
-from zeta import zeta
+from zeta import zeta, zeta_many
 from utils import write_csv
 from riemann_siegel import find_zeros_riemann_siegel
 from zeros_odlyzko import find_zeros_odlyzko
@@ -147,12 +148,12 @@ def main() -> None:
         return
 
     # Standard-Befehl: ζ(s)-Berechnung über Bereich
-    results: List[Tuple[complex, complex]] = []
-    s = args.start
-    while s.real <= args.end.real and s.imag <= args.end.imag:
-        val = zeta(s)
-        results.append((s, val))
-        s = complex(s.real + args.step, s.imag + args.step)
+    start, end, step = args.start, args.end, args.step
+    n_steps = min((end.real - start.real) / step, (end.imag - start.imag) / step)
+    s_grid = start + step * (1 + 1j) * np.arange(max(math.floor(n_steps) + 1, 0))
+    # Ein workdps-Kontext für das ganze Gitter; Wiederholungen trifft der zeta-Cache
+    s_list = s_grid.tolist()
+    results: List[Tuple[complex, complex]] = list(zip(s_list, zeta_many(s_list)))
 
     write_csv(results, args.output)
     print(f"Ergebnisse gespeichert in {args.output}")
@@ -3,15 +3,27 @@
 import csv
 import time
 from pathlib import Path
+
+import numpy as np
 from zeros import find_zeros
-from explicit_formula import pi_explicit, riemann_psi
+from explicit_formula import riemann_psi_batch, truncate_zeros
 from prime_connection import generate_primes
 
 
+# Arbeitsverzeichnisse, in denen data/ bereits angelegt wurde
+_DATA_DIR_CWDS = set()
+
+
 def ensure_data_directory():
-    """Stellt sicher, dass der data/-Ordner existiert."""
+    """
+    Stellt sicher, dass der data/-Ordner im aktuellen Arbeitsverzeichnis
+    existiert (mkdir einmal pro Arbeitsverzeichnis).
+    """
     data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
+    cwd = Path.cwd()
+    if cwd not in _DATA_DIR_CWDS:
+        data_dir.mkdir(exist_ok=True)
+        _DATA_DIR_CWDS.add(cwd)
     return data_dir
 
 
@@ -27,20 +39,32 @@ def collect_zeros(max_imag_height, output_file="zeros.csv"):
     data_dir = ensure_data_directory()
     filepath = data_dir / output_file
 
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["index", "real_part", "imag_part"])
-        for i, zero in enumerate(zeros, 1):
-            writer.writerow([i, float(zero.real), float(zero.imag)])
+    count = len(zeros)
+    idx = np.arange(1, count + 1, dtype=np.int64)
+    reals = np.fromiter((z.real for z in zeros), dtype=np.float64, count=count)
+    imags = np.fromiter((z.imag for z in zeros), dtype=np.float64, count=count)
+    np.savetxt(
+        filepath,
+        np.column_stack([idx, reals, imags]),
+        fmt=["%d", "%s", "%s"],
+        delimiter=",",
+        header="index,real_part,imag_part",
+        comments="",
+        encoding="utf-8",
+    )
 
     elapsed = time.time() - start_time
     print(f"✓ {len(zeros)} Nullstellen in {elapsed:.2f}s gesammelt → {filepath}")
     return zeros
 
 
-def compare_pi_methods(x_values, zeros, output_file="pi_comparison.csv"):
+def compare_pi_methods(x_values, zeros, output_file="pi_comparison.csv", T=None):
     """
     Vergleicht verschiedene π(x)-Berechnungsmethoden für gegebene x-Werte.
+
+    Args:
+        T: Im-Grenzwert für die Explizitformel; die Nullstellen werden einmalig
+           darauf gekürzt (None: alle verwenden)
     """
     print(f"Vergleiche π(x)-Methoden für {len(x_values)} x-Werte...")
     start_time = time.time()
@@ -48,6 +72,51 @@ def compare_pi_methods(x_values, zeros, output_file="pi_comparison.csv"):
     data_dir = ensure_data_directory()
     filepath = data_dir / output_file
 
+    # Nullstellen einmal auf |Im(ρ)| ≤ T kürzen statt pro x
+    zeros_T = truncate_zeros(zeros, T)
+
+    # ψ(x) für alle x in einem Durchlauf über die Nullstellen
+    x_valid = [x for x in x_values if x >= 2]
+    psi_values = riemann_psi_batch(x_valid, zeros_T)
+    log_values = np.log(np.asarray(x_valid, dtype=np.float64))
+
+    # Einmal bis max(x) sieben, π(x) danach per Binärsuche
+    all_primes = np.array(generate_primes(int(max(x_values, default=0))))
+
+    rows = []
+    for x, psi_x, log_x in zip(x_valid, psi_values, log_values):
+        # Exakte π(x) via Sieb
+        pi_exact = int(np.searchsorted(all_primes, x, side="right"))
+
+        # Standardnäherung x/log(x)
+        pi_approx = x / float(log_x)
+
+        # Explizitformel π(x) ≈ ψ(x)/log(x)
+        pi_expl = float(psi_x) / float(log_x)
+
+        # Fehler berechnen
+        error_approx = abs(pi_exact - pi_approx)
+        error_explicit = abs(pi_exact - pi_expl)
+
+        rows.append(
+            [
+                x,
+                pi_exact,
+                pi_approx,
+                pi_expl,
+                error_approx,
+                error_explicit,
+                len(zeros_T),
+            ]
+        )
+
+        if len(x_values) <= 20:  # Detaillierte Ausgabe nur bei wenigen Werten
+            print(
+                f"  x={x:6.0f}: π={pi_exact:4.0f}, "
+                f"Näherung={pi_approx:6.1f}, Explizit={pi_expl:6.1f}"
+            )
+
+    # Alle Zeilen gesammelt in einem Aufruf schreiben
     with open(filepath, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(
@@ -61,45 +130,7 @@ def compare_pi_methods(x_values, zeros, output_file="pi_comparison.csv"):
                 "num_zeros_used",
             ]
         )
-
-        for x in x_values:
-            if x < 2:
-                continue
-
-            # Exakte π(x) via Sieb
-            primes = generate_primes(int(x))
-            pi_exact = len(primes)
-
-            # Standardnäherung x/log(x)
-            import math
-
-            pi_approx = x / math.log(x)
-
-            # Explizitformel
-            pi_expl_raw = pi_explicit(x, zeros)
-            pi_expl = float(pi_expl_raw)  # mpmath -> float konvertieren
-
-            # Fehler berechnen
-            error_approx = abs(pi_exact - pi_approx)
-            error_explicit = abs(pi_exact - pi_expl)
-
-            writer.writerow(
-                [
-                    x,
-                    pi_exact,
-                    pi_approx,
-                    pi_expl,
-                    error_approx,
-                    error_explicit,
-                    len(zeros),
-                ]
-            )
-
-            if len(x_values) <= 20:  # Detaillierte Ausgabe nur bei wenigen Werten
-                print(
-                    f"  x={x:6.0f}: π={pi_exact:4.0f}, "
-                    f"Näherung={pi_approx:6.1f}, Explizit={pi_expl:6.1f}"
-                )
+        writer.writerows(rows)
 
     elapsed = time.time() - start_time
     print(f"✓ Vergleich abgeschlossen in {elapsed:.2f}s → {filepath}")
@@ -4,45 +4,305 @@ explicit_formula.py – Berechnung der verallgemeinerten Chebyshev-Funktion ψ(x
 über die Riemann-Explizitformel und Kontrolle über Primzahlen.
 
 Funktionen:
-- riemann_psi(x, zeros, T=None)
-- pi_explicit(x, zeros, T=None)
+- truncate_zeros(zeros, T)
+- precompute_mp_zeros(zeros, T=None)
+- riemann_psi(x, zeros, T=None, precomputed=None, zeros_truncated=False)
+- riemann_psi_batch(x_values, zeros, T=None)
+- pi_explicit(x, zeros, T=None, precomputed=None, log_x=None)
 - psi_via_primes(x)
 """
-from typing import List, Optional
+import atexit
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
 
 import mpmath as mp
+import numpy as np
 
 from zeros import find_zeros
 from prime_connection import generate_primes
 
+try:
+    import flint
+
+    HAVE_FLINT = True
+except ImportError:  # python-flint ist optional
+    HAVE_FLINT = False
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # numba ist optional
+    HAVE_NUMBA = False
+
 # Setze Präzision für mpmath (50 Dezimalstellen)
 mp.mp.dps = 50
 
+# Konstanten für den Double- bzw. mpmath-Pfad
+_LOG_2PI = math.log(2 * math.pi)
+_MP_LOG_2PI = mp.log(2 * mp.pi)
+
+# Oberhalb dieser Schranken wird auf mpmath ausgewichen
+_DOUBLE_DPS = 17
+_DOUBLE_X_MAX = 1e15
+
+# Anzahl x-Werte pro Block in riemann_psi_batch (hält die x×ρ-Matrix im Cache)
+_BATCH_X_BLOCK = 1024
+
+# Geometrische x-Folgen: alle so viele Schritte wird x^ρ exakt neu berechnet
+_GEOMETRIC_REANCHOR = 64
+# Toleranz der Schritte log(x_{k+1}/x_k), ab der eine Folge als geometrisch gilt
+_GEOMETRIC_LOG_ATOL = 1e-13
+
+# Bis zu dieser Präzision rechnet der mpmath-Pfad mit Arb-Ballarithmetik (python-flint)
+_FLINT_MAX_DPS = 50
 
-def riemann_psi(x: float, zeros: List[complex], T: Optional[float] = None) -> float:
+# Ab diesem Aufwand (Anzahl Nullstellen · mp.dps) wird die mpmath-Summe auf
+# Prozesse verteilt; darunter ist die serielle Summe schneller als der
+# Versand der Nullstellen an den Pool (10^4 Nullstellen bei 50 Stellen ≈ 0.6 s)
+_PARALLEL_MIN_WORK = 500_000
+
+# Prozess-Pool für _zero_sum_parallel: einmal gestartet, über Aufrufe hinweg
+# wiederverwendet und beim Beenden des Interpreters heruntergefahren
+_EXECUTOR: Optional[ProcessPoolExecutor] = None
+_EXECUTOR_WORKERS = 0
+
+
+MpZeros = Tuple[List[mp.mpc], List[mp.mpc]]
+
+
+def truncate_zeros(zeros: List[complex], T: Optional[float]) -> List[complex]:
+    """
+    Behält nur Nullstellen mit |Im(ρ)| ≤ T (Maske vektorisiert über NumPy).
+    Für T=None wird zeros unverändert zurückgegeben.
+    """
+    if T is None:
+        return zeros
+    imag = np.fromiter((rho.imag for rho in zeros), dtype=np.float64, count=len(zeros))
+    return [zeros[i] for i in np.flatnonzero(np.abs(imag) <= T)]
+
+
+def precompute_mp_zeros(zeros: List[complex], T: Optional[float] = None) -> MpZeros:
+    """
+    Wandelt die Nullstellen einmalig in mpmath-Zahlen um, damit der
+    mpmath-Pfad von riemann_psi sie bei wiederholten Aufrufen (z.B. über
+    viele x) nicht erneut konvertieren muss.
+
+    Argumente:
+        zeros  (List[complex]): Nullstellen ρ
+        T      (Optional[float]): Im-Grenzwert; Nullstellen darüber werden verworfen
+
+    Rückgabe:
+        (mpc_zeros, inv_rhos) mit inv_rhos[i] = 1/mpc_zeros[i]
+    """
+    mpc_zeros = [mp.mpc(rho.real, rho.imag) for rho in truncate_zeros(zeros, T)]
+    inv_rhos = [1 / rho_mp for rho_mp in mpc_zeros]
+    return mpc_zeros, inv_rhos
+
+
+if HAVE_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _psi_fast(x: float, rhos: np.ndarray) -> float:
+        """JIT-kompilierte Double-Variante von ψ(x) mit paralleler Reduktion."""
+        logx = np.log(x)
+        total = 0.0
+        for i in prange(rhos.size):
+            total += (np.exp(rhos[i] * logx) / rhos[i]).real
+        return x - total - np.log(2 * np.pi)
+
+
+def _psi_chunk(args: Tuple[float, List[mp.mpc], List[mp.mpc], int]) -> mp.mpc:
+    """Teilsumme Σ x^ρ/ρ über einen Block von Nullstellen (Worker-Funktion)."""
+    x, rhos_chunk, inv_chunk, dps = args
+    mp.mp.dps = dps
+    x_mp = mp.mpf(x)
+    return mp.fsum(mp.power(x_mp, rho) * inv for rho, inv in zip(rhos_chunk, inv_chunk))
+
+
+def _shutdown_executor() -> None:
+    """Beendet den Prozess-Pool von _zero_sum_parallel, falls gestartet."""
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown()
+        _EXECUTOR, _EXECUTOR_WORKERS = None, 0
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """Prozess-Pool mit workers Prozessen; der Start (je Worker ein Import von
+    numpy, numba und mpmath) fällt nur beim ersten Aufruf an."""
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    if _EXECUTOR is None or _EXECUTOR_WORKERS != workers:
+        if _EXECUTOR is None:
+            atexit.register(_shutdown_executor)
+        else:
+            _EXECUTOR.shutdown()
+        # "spawn" statt fork: ein Fork nach dem Start der numba-Threads von
+        # _psi_fast lässt den Elternprozess beim Beenden hängen
+        ctx = multiprocessing.get_context("spawn")
+        _EXECUTOR = ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+        _EXECUTOR_WORKERS = workers
+    return _EXECUTOR
+
+
+def _zero_sum_parallel(
+    x: float, mpc_zeros: List[mp.mpc], inv_rhos: List[mp.mpc]
+) -> mp.mpc:
+    """Verteilt Σ x^ρ/ρ blockweise auf os.cpu_count() Prozesse."""
+    n_chunks = os.cpu_count() or 1
+    size = -(-len(mpc_zeros) // n_chunks)
+    tasks = [
+        (x, mpc_zeros[i : i + size], inv_rhos[i : i + size], mp.mp.dps)
+        for i in range(0, len(mpc_zeros), size)
+    ]
+    partials = list(_get_executor(n_chunks).map(_psi_chunk, tasks))
+    # Feste Reihenfolge + fsum: deterministische, kompensierte Reduktion
+    return mp.fsum(partials)
+
+
+def _zero_sum_flint(x: float, zeros: List[complex]) -> mp.mpc:
+    """Σ x^ρ/ρ in Arb-Ballarithmetik (python-flint) bei aktueller mp.dps."""
+    old_dps = flint.ctx.dps
+    flint.ctx.dps = mp.mp.dps
+    try:
+        log_x = flint.arb(x).log()
+        total = flint.acb(0)
+        for rho in zeros:
+            rho_acb = flint.acb(rho.real, rho.imag)
+            total += (rho_acb * log_x).exp() / rho_acb
+        digits = mp.mp.dps + 5
+        return mp.mpc(
+            total.real.mid().str(digits, radius=False),
+            total.imag.mid().str(digits, radius=False),
+        )
+    finally:
+        flint.ctx.dps = old_dps
+
+
+def riemann_psi(
+    x: float,
+    zeros: List[complex],
+    T: Optional[float] = None,
+    precomputed: Optional[MpZeros] = None,
+    zeros_truncated: bool = False,
+) -> float:
     """
     Berechnet die verallgemeinerte Chebyshev-Funktion ψ(x) über die Riemann-Explizitformel:
         ψ(x) = x - Σ_{ρ:|Im(ρ)|≤T}(x^ρ / ρ) - log(2π)
 
+    Bei mp.dps ≤ 17 (und x ≤ 1e15) wird die Summe in complex128 ausgewertet,
+    mit numba JIT-kompiliert und parallel, sonst vektorisiert mit NumPy. Sonst
+    bis mp.dps ≤ 50 mit Arb-Ballarithmetik, falls python-flint installiert ist
+    und precomputed fehlt, ansonsten elementweise mit mpmath
+    (ab 10^4 Nullstellen bei 50 Stellen verteilt auf einen Prozess-Pool).
+
     Argumente:
         x      (float): Auswertungsstelle > 1
         zeros  (List[complex]): Nullstellen ρ mit Im(ρ) > 0
         T      (Optional[float]): Im-Grenzwert; falls None, werden alle zeros genutzt
+        precomputed (Optional[MpZeros]): Ergebnis von precompute_mp_zeros(zeros, T);
+                    wählt oberhalb der Double-Präzision ausdrücklich den
+                    mpmath-Pfad (Vorrang vor python-flint)
+        zeros_truncated (bool): True, wenn zeros bereits per truncate_zeros(zeros, T)
+                    gekürzt wurden; die T-Filterung entfällt dann
 
     Rückgabe:
         ψ(x) (float)
     """
-    x_mp = mp.mpf(x)
-    psi_value = x_mp
-    for rho in zeros:
-        if T is None or abs(rho.imag) <= T:
-            rho_mp = mp.mpc(rho.real, rho.imag)
-            psi_value -= mp.power(x_mp, rho_mp) / rho_mp
-    psi_value -= mp.log(2 * mp.pi)
-    return float(psi_value.real)
+    if not zeros_truncated:
+        zeros = truncate_zeros(zeros, T)
+
+    if x > _DOUBLE_X_MAX or mp.mp.dps > _DOUBLE_DPS:
+        # Übergebene mpmath-Nullstellen haben Vorrang, sonst Arb wenn verfügbar
+        if precomputed is None and HAVE_FLINT and mp.mp.dps <= _FLINT_MAX_DPS:
+            zero_sum = _zero_sum_flint(x, zeros)
+        else:
+            mpc_zeros, inv_rhos = (
+                precomputed
+                if precomputed is not None
+                else precompute_mp_zeros(zeros)
+            )
+            work = len(mpc_zeros) * mp.mp.dps
+            if work >= _PARALLEL_MIN_WORK and (os.cpu_count() or 1) > 1:
+                zero_sum = _zero_sum_parallel(x, mpc_zeros, inv_rhos)
+            else:
+                x_mp = mp.mpf(x)
+                zero_sum = mp.fsum(
+                    mp.power(x_mp, rho_mp) * inv_rho
+                    for rho_mp, inv_rho in zip(mpc_zeros, inv_rhos)
+                )
+        psi_value = mp.mpf(x) - zero_sum - _MP_LOG_2PI
+        return float(psi_value.real)
 
+    # Double-Präzision: vektorisierte Summe über alle Nullstellen
+    rhos = np.asarray(zeros, dtype=np.complex128)
+    if HAVE_NUMBA:
+        return float(_psi_fast(float(x), rhos))
+    # x^ρ = exp(ρ·log x): ein exp pro Term statt log+exp in np.power
+    terms = np.exp(rhos * math.log(x)) / rhos
+    return float(x - terms.sum().real - _LOG_2PI)
 
-def pi_explicit(x: float, zeros: List[complex], T: Optional[float] = None) -> float:
+
+def riemann_psi_batch(
+    x_values: List[float], zeros: List[complex], T: Optional[float] = None
+) -> np.ndarray:
+    """
+    Wertet ψ(x) für viele x gleichzeitig in Double-Präzision aus.
+
+    Wegen x^ρ = exp(ρ·log x) ist log x die einzige x-abhängige Größe; alle
+    Terme entstehen als Broadcast exp(log(x)[:, None] * ρ[None, :]) / ρ in
+    einem Durchlauf über die Nullstellen. Bilden die x eine geometrische
+    Folge (wie 10·2^k), genügt statt eines exp pro (x, ρ) eine Multiplikation.
+
+    Argumente:
+        x_values (List[float]): Auswertungsstellen > 1
+        zeros    (List[complex]): Nullstellen ρ
+        T        (Optional[float]): Im-Grenzwert für die Explizitformel
+
+    Rückgabe:
+        ψ(x) für alle x (np.ndarray, float64)
+    """
+    x_arr = np.asarray(x_values, dtype=np.float64)
+    rhos = np.asarray(zeros, dtype=np.complex128)
+    if T is not None:
+        rhos = rhos[np.abs(rhos.imag) <= T]
+    inv_rhos = 1.0 / rhos
+    logx = np.log(x_arr)
+    zero_sum = np.empty(x_arr.shape, dtype=np.float64)
+    log_steps = np.diff(logx)
+    # Nur (bis auf Rundung) exakt geometrische Folgen: die Rekursion wertet bei
+    # x_0·r^k aus, schon relative Abweichungen von 1e-5 verfälschen ψ merklich
+    if log_steps.size >= 2 and np.allclose(
+        log_steps, log_steps[0], rtol=0, atol=_GEOMETRIC_LOG_ATOL
+    ):
+        # Geometrische x-Folge: x_k^ρ = x_0^ρ · (e^{ρ·d})^k als Rekursion
+        ratio = np.exp(rhos * log_steps[0])
+        for k in range(x_arr.size):
+            if k % _GEOMETRIC_REANCHOR == 0:
+                # Periodisch exakt neu ansetzen, damit sich
+                # Rundungsfehler nicht aufschaukeln
+                terms = np.exp(rhos * logx[k]) * inv_rhos
+            else:
+                terms *= ratio
+            zero_sum[k] = terms.sum().real
+        return x_arr - zero_sum - _LOG_2PI
+
+    for lo in range(0, x_arr.size, _BATCH_X_BLOCK):
+        block = logx[lo : lo + _BATCH_X_BLOCK, None] * rhos[None, :]
+        zero_sum[lo : lo + _BATCH_X_BLOCK] = (np.exp(block) @ inv_rhos).real
+    return x_arr - zero_sum - _LOG_2PI
+
+
+def pi_explicit(
+    x: float,
+    zeros: List[complex],
+    T: Optional[float] = None,
+    precomputed: Optional[MpZeros] = None,
+    log_x: Optional[float] = None,
+) -> float:
     """
     Näherung von π(x) über ψ(x):
         π(x) ≈ ψ(x) / log(x)
@@ -51,12 +311,18 @@ def pi_explicit(x: float, zeros: List[complex], T: Optional[float] = None) -> fl
         x      (float): Auswertungsstelle > 1
         zeros  (List[complex]): Nullstellen ρ
         T      (Optional[float]): Im-Grenzwert für die Explizitformel
+        precomputed (Optional[MpZeros]): siehe riemann_psi
+        log_x  (Optional[float]): vorab berechnetes log(x), z.B. aus einer Tabelle
 
     Rückgabe:
         π(x) (float)
     """
-    psi_value = riemann_psi(x, zeros, T=T)
-    return float(mp.mpf(psi_value) / mp.log(mp.mpf(x)))
+    psi_value = riemann_psi(x, zeros, T=T, precomputed=precomputed)
+    if log_x is not None:
+        return psi_value / log_x
+    if mp.mp.dps > _DOUBLE_DPS:
+        return float(mp.mpf(psi_value) / mp.log(mp.mpf(x)))
+    return psi_value / math.log(x)
 
 
 def psi_via_primes(x: float) -> float:
@@ -65,6 +331,7 @@ def psi_via_primes(x: float) -> float:
         ψ(x) = Σ_{p^k ≤ x} log(p),
     wobei für jede Primzahl p die maximale Vielfachheit k bestimmt wird:
         k = ⌊log(x) / log(p)⌋
+    Bei mp.dps ≤ 17 vektorisiert mit NumPy (float64).
 
     Argumente:
         x      (float): Auswertungsstelle > 1
@@ -72,13 +339,22 @@ def psi_via_primes(x: float) -> float:
     Rückgabe:
         ψ(x) (float)
     """
+    primes = generate_primes(int(x))
+    if mp.mp.dps <= _DOUBLE_DPS:
+        primes_arr = np.asarray(primes, dtype=np.float64)
+        logp = np.log(primes_arr)
+        max_k = np.floor(math.log(x) / logp + 1e-9)
+        # Rundung bei exakten Primzahlpotenzen (z.B. 3^5 = 243) korrigieren
+        max_k -= np.power(primes_arr, max_k) > x
+        return float((logp * max_k).sum())
+
     x_mp = mp.mpf(x)
+    log_x = mp.log(x_mp)
     psi_sum = mp.mpf(0)
-    primes = generate_primes(int(x))
     for p in primes:
-        p_mp = mp.mpf(p)
-        max_k = int(mp.floor(mp.log(x_mp) / mp.log(p_mp)))
-        psi_sum += mp.log(p_mp) * max_k
+        log_p = mp.log(mp.mpf(p))
+        max_k = int(mp.floor(log_x / log_p))
+        psi_sum += log_p * max_k
     return float(psi_sum)
 
 
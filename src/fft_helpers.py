@@ -2,6 +2,9 @@ import numpy as np
 from scipy.fft import fft, ifft, next_fast_len
 import logging
 
+# Zeilen pro Block in compute_rational_evaluation_grid
+_GRID_TILE_ROWS = 4096
+
 
 def optimal_fft_length(n: int) -> int:
     """
@@ -19,17 +22,16 @@ def compute_rational_evaluation_grid(
     coeffs: ndarray der Form [[a0, β0], [a1, β1], ...]
     roots_of_unity: ndarray komplexer Einheitswurzeln
     """
-    coeffs_arr = np.asarray(coeffs, dtype=complex)
+    coeffs_arr = np.asarray(coeffs, dtype=complex).reshape(-1, 2)
     roots_arr = np.asarray(roots_of_unity, dtype=complex)
+    a = coeffs_arr[:, 0][None, :]
+    beta = coeffs_arr[:, 1][None, :]
     length = roots_arr.shape[0]
     results = np.zeros(length, dtype=complex)
-    for idx in range(length):
-        omega = roots_arr[idx]
-        total = 0 + 0j
-        for pair in coeffs_arr:
-            a_k, beta_k = pair
-            total += a_k / (omega - beta_k)
-        results[idx] = total
+    # Cauchy-Matrix blockweise über ω_j, damit die Zwischenmatrix im Cache bleibt
+    for lo in range(0, length, _GRID_TILE_ROWS):
+        tile = roots_arr[lo : lo + _GRID_TILE_ROWS, None]
+        results[lo : lo + _GRID_TILE_ROWS] = (a / (tile - beta)).sum(axis=1)
     return results
 
 
@@ -51,10 +53,31 @@ class FFTInterpolator:
         self.delta = float(delta)
         self.t_start = float(t_start)
         self.logger = logging.getLogger(__name__)
-        if self.grid_data.size > 0:
+        n = self.grid_data.size
+        if n > 0:
             self._fft_data = fft(self.grid_data)
+            # 2×-Upsampling einmalig per Zero-Padding im Frequenzraum
+            half = n // 2
+            freq = np.zeros(2 * n, dtype=complex)
+            freq[:half] = self._fft_data[:half]
+            freq[2 * n - (n - half) :] = self._fft_data[half:]
+            self._upsampled = ifft(freq) * 2
         else:
             self._fft_data = np.zeros((1,), dtype=complex)
+            self._upsampled = np.zeros((0,), dtype=complex)
+
+    def _extrapolate(self, t_val: float, x: float) -> complex:
+        """Lineare Fortsetzung außerhalb des Grids."""
+        n = len(self.grid_data)
+        self.logger.warning(f"t={t_val} außerhalb des Grid-Bereichs")
+        if x < 0 and n > 1:
+            slope = (self.grid_data[1] - self.grid_data[0]) / self.delta
+            return self.grid_data[0] + slope * (t_val - self.t_start)
+        if n > 1:
+            end_t = self.t_start + (n - 1) * self.delta
+            slope = (self.grid_data[-1] - self.grid_data[-2]) / self.delta
+            return self.grid_data[-1] + slope * (t_val - end_t)
+        return self.grid_data[0]
 
     def interpolate(self, t: float) -> complex:
         """
@@ -62,33 +85,35 @@ class FFTInterpolator:
         """
         t_val = float(t)
         x = (t_val - self.t_start) / self.delta if self.delta != 0 else 0.0
-        # Vorher: n = self.grid_data.shape[0]
-        n = len(self.grid_data)  # Vermeidet shape-Zugriff auf tuple
+        n = len(self.grid_data)
         if n == 0:
             return 0 + 0j
         if x < 0 or x >= n:
-            self.logger.warning(f"t={t_val} außerhalb des Grid-Bereichs")
-            if x < 0 and n > 1:
-                slope = (self.grid_data[1] - self.grid_data[0]) / self.delta
-                return self.grid_data[0] + slope * (t_val - self.t_start)
-            if n > 1:
-                end_t = self.t_start + (n - 1) * self.delta
-                slope = (self.grid_data[-1] - self.grid_data[-2]) / self.delta
-                return self.grid_data[-1] + slope * (t_val - end_t)
-            return self.grid_data[0]
+            return self._extrapolate(t_val, x)
 
-        pad = 2 * n
-        freq = np.zeros(pad, dtype=complex)
-        half = n // 2
-        fft_data = (
-            self._fft_data
-            if hasattr(self._fft_data, "__len__")
-            else np.zeros(n, dtype=complex)
-        )
-        freq[:half] = fft_data[:half]
-        freq[-half:] = fft_data[half:]
-        vals = ifft(freq) * 2
         idx = int(round(x * 2))
-        if 0 <= idx < len(vals):
-            return vals[idx]
+        if 0 <= idx < len(self._upsampled):
+            return self._upsampled[idx]
         return self.grid_data[-1]
+
+    def batch_interpolate(self, ts: np.ndarray) -> np.ndarray:
+        """
+        Vektorisierte Variante von interpolate für ein Array von t-Werten.
+        """
+        t_arr = np.asarray(ts, dtype=float)
+        n = len(self.grid_data)
+        if n == 0:
+            return np.zeros(t_arr.shape, dtype=complex)
+        if self.delta != 0:
+            x = (t_arr - self.t_start) / self.delta
+        else:
+            x = np.zeros(t_arr.shape)
+        result = np.empty(t_arr.shape, dtype=complex)
+        inside = (x >= 0) & (x < n)
+        # Index 2n (Rundung am rechten Rand) fällt wie in interpolate auf grid_data[-1]
+        lookup = np.append(self._upsampled, self.grid_data[-1])
+        idx = np.rint(x[inside] * 2).astype(np.int64)
+        result[inside] = lookup[np.minimum(idx, len(self._upsampled))]
+        for pos in np.flatnonzero(~inside.ravel()):
+            result.flat[pos] = self._extrapolate(float(t_arr.flat[pos]), x.flat[pos])
+        return result
@@ -9,12 +9,39 @@ Methodenwahl basierend auf dem Imaginärteil von s.
 """
 
 import mpmath as mp
-from typing import Union
-from zeta import zeta
+import timeit
+from functools import lru_cache
+from typing import Callable, Union
+from zeta import zeta, zeta_constants, zeta_uncached
 
 __all__ = ["zeta_via_functional", "zeta_complete", "benchmark_methods"]
 
 
+@lru_cache(maxsize=8192)
+def _cached_zeta(real: float, imag: float) -> mp.mpc:
+    """ζ(s) gecacht über (Re s, Im s); zeta rechnet unabhängig von mp.dps."""
+    return zeta(complex(real, imag))
+
+
+def _compute_prefactor(s: mp.mpc, dps: int) -> mp.mpc:
+    """Vorfaktor 2^s π^(s−1) sin(π s/2) Γ(1−s) der funktionalen Gleichung."""
+    consts = zeta_constants(dps)
+    # 2^s π^(s−1) = exp(s·log 2π)/π: ein exp statt zweier Potenzen
+    factor_exp = mp.exp(s * consts["log2pi"]) / consts["pi"]
+    factor_sin = mp.sin(mp.pi * s / 2)
+    factor_gamma = mp.gamma(1 - s)
+    return factor_exp * factor_sin * factor_gamma
+
+
+@lru_cache(maxsize=4096)
+def _prefactor(real: float, imag: float, dps: int) -> mp.mpc:
+    """
+    Gecachter Vorfaktor über (Re s, Im s, mp.dps), da Scans dieselben Stellen
+    wiederholt auswerten.
+    """
+    return _compute_prefactor(mp.mpc(real, imag), dps)
+
+
 def zeta_via_functional(s: Union[complex, float]) -> complex:
     """
     Berechnet ζ(s) mithilfe der funktionalen Gleichung:
@@ -31,15 +58,9 @@ def zeta_via_functional(s: Union[complex, float]) -> complex:
     """
     s = complex(s)  # Sicherstellen, dass s komplex ist
 
-    # Berechnung der Faktoren
-    factor_2s = 2**s
-    factor_pi = mp.pi ** (s - 1)
-    factor_sin = mp.sin(mp.pi * s / 2)
-    factor_gamma = mp.gamma(1 - s)
-
     # Funktionale Gleichung anwenden
-    prefactor = factor_2s * factor_pi * factor_sin * factor_gamma
-    zeta_1_minus_s = zeta(1 - s)
+    prefactor = _prefactor(s.real, s.imag, mp.mp.dps)
+    zeta_1_minus_s = _cached_zeta(1 - s.real, -s.imag)
 
     return complex(prefactor * zeta_1_minus_s)
 
@@ -62,22 +83,40 @@ def zeta_complete(s: Union[complex, float], threshold: float = 50.0) -> complex:
     if abs(s.imag) >= threshold:
         return zeta_via_functional(s)
     else:
-        return zeta(s)
+        return _cached_zeta(s.real, s.imag)
+
+
+def _zeta_via_functional_uncached(s: complex) -> complex:
+    """Wie zeta_via_functional, aber Vorfaktor und ζ(1−s) ohne Caches."""
+    prefactor = _compute_prefactor(mp.mpc(s), mp.mp.dps)
+    return complex(prefactor * zeta_uncached(1 - s))
+
+
+def _time_per_call(func: Callable[[], object], runs: int) -> float:
+    """
+    Bestzeit pro Aufruf über `runs` Messungen; jede Messung wiederholt func
+    per timeit.Timer.autorange, bis mindestens 0.2 s vergangen sind.
+    """
+    timer = timeit.Timer(func)
+    best = float("inf")
+    for _ in range(max(runs, 1)):
+        number, total = timer.autorange()
+        best = min(best, total / number)
+    return best
 
 
 def benchmark_methods(s_values: list, runs: int = 3) -> dict:
     """
     Vergleicht Laufzeiten zwischen direkter Berechnung und funktionaler Gleichung.
+    Gemessen werden ungecachte Auswertungen, sonst zählten nur Cache-Treffer.
 
     Args:
         s_values: Liste von komplexen Zahlen zum Testen
-        runs: Anzahl der Durchläufe für Mittelwertbildung
+        runs: Anzahl der Messungen je Methode (es zählt die beste)
 
     Returns:
         Dictionary mit Benchmark-Ergebnissen
     """
-    import time
-
     results = {
         "direct_times": [],
         "functional_times": [],
@@ -86,21 +125,9 @@ def benchmark_methods(s_values: list, runs: int = 3) -> dict:
     }
 
     for s in s_values:
-        # Direkte Methode
-        direct_times = []
-        for _ in range(runs):
-            start = time.time()
-            zeta(s)
-            direct_times.append(time.time() - start)
-        avg_direct = sum(direct_times) / len(direct_times)
-
-        # Funktionale Gleichung
-        func_times = []
-        for _ in range(runs):
-            start = time.time()
-            zeta_via_functional(s)
-            func_times.append(time.time() - start)
-        avg_func = sum(func_times) / len(func_times)
+        s = complex(s)
+        avg_direct = _time_per_call(lambda: zeta_uncached(s), runs)
+        avg_func = _time_per_call(lambda: _zeta_via_functional_uncached(s), runs)
 
         results["direct_times"].append(avg_direct)
         results["functional_times"].append(avg_func)
@@ -127,7 +154,7 @@ def validate_functional_equation(
     s = complex(s)
 
     # Beide Methoden ausführen und in built-in complex umwandeln
-    direct_raw = zeta(s)
+    direct_raw = _cached_zeta(s.real, s.imag)
     functional_raw = zeta_via_functional(s)
     direct = complex(direct_raw)
     functional = complex(functional_raw)
@@ -1,44 +1,71 @@
+import cmath
 import numpy as np
-from typing import Callable, List, Tuple
+from typing import Callable, List, Optional, Sequence, Tuple
 import logging
 
 
 def finite_difference(
-    f: Callable[[float], complex], t: float, h: float = 1e-6
+    f: Callable[[float], complex],
+    t: float,
+    h: float = 1e-6,
+    f_t: Optional[complex] = None,
 ) -> Tuple[complex, complex]:
     """
     Liefert (f'(t), f''(t)) per zentraler Differenz:
       f'(t) ≈ [f(t+h)-f(t-h)]/(2h)
       f''(t) ≈ [f(t+h)-2f(t)+f(t-h)]/h^2
+    Ist f(t) bereits bekannt, kann es als f_t übergeben werden.
     """
     f_plus = f(t + h)
     f_minus = f(t - h)
+    if f_t is None:
+        f_t = f(t)
     deriv1 = (f_plus - f_minus) / (2 * h)
-    deriv2 = (f_plus - 2 * f(t) + f_minus) / (h * h)
+    deriv2 = (f_plus - 2 * f_t + f_minus) / (h * h)
     return deriv1, deriv2
 
 
+def taylor_derivatives(f: Callable[[float], complex], t0: float) -> List[complex]:
+    """
+    Liefert [f(t0), f'(t0), f''(t0)] mit insgesamt drei Auswertungen von f.
+    """
+    value = f(t0)
+    deriv1, deriv2 = finite_difference(f, t0, f_t=value)
+    return [value, deriv1, deriv2]
+
+
 def taylor_expansion(
-    f: Callable[[float], complex], t0: float, t: float, max_terms: int = 5
+    f: Callable[[float], complex],
+    t0: float,
+    t: float,
+    max_terms: int = 5,
+    derivs: Optional[Sequence[complex]] = None,
 ) -> complex:
     """
     Taylor-Entwicklung von f um t0, bis max_terms.
+    Bereits berechnete Ableitungen (siehe taylor_derivatives) können über
+    derivs wiederverwendet werden.
     """
     dt = t - t0
-    value = f(t0)
-    deriv1, deriv2 = finite_difference(f, t0)
-    terms = [value]
-    if max_terms >= 1:
-        terms.append(deriv1 * dt)
-    if max_terms >= 2:
-        terms.append(deriv2 * (dt**2) / 2)
-    # Höhere Terme per finite difference mehrfach (optional)
-    result = sum(terms)
+    if derivs is None:
+        derivs = taylor_derivatives(f, t0)
+    # coeff = dt^k / k! wird mitgeführt statt dt**k neu zu potenzieren
+    result = derivs[0]
+    coeff = 1.0
+    for k in range(1, min(max_terms, len(derivs) - 1) + 1):
+        coeff *= dt / k
+        result += derivs[k] * coeff
     return result
 
 
 class AdaptiveInterpolator:
-    """Adaptive Interpolation mit automatischer Genauigkeitskontrolle."""
+    """
+    Taylor-Interpolation um den nächsten Gitterpunkt mit linearem Fallback.
+
+    Der Parameter tol wird nur aus Kompatibilitätsgründen angenommen und
+    ignoriert: interpolate nutzt stets alle verfügbaren Ordnungen, einen
+    Konvergenztest zwischen den Ordnungen gibt es nicht mehr.
+    """
 
     def __init__(self, tol: float = 1e-12):
         self.tol = tol
@@ -52,19 +79,18 @@ class AdaptiveInterpolator:
         t: float,
     ) -> complex:
         """
-        Versucht stufenweise Taylor-Expansion bis Konvergenz < tol,
-        Fallback auf lineare Interpolation.
+        Taylor-Expansion um den nächsten Gitterpunkt mit allen verfügbaren
+        Ordnungen; die Ableitungen werden dafür nur einmal bestimmt.
+        Fallback auf lineare Interpolation, falls das Ergebnis nicht endlich ist.
         """
         # nächster Gitterindex
         dists = [abs(t - gp) for gp in grid_points]
         i0 = int(np.argmin(dists))
         t0 = grid_points[i0]
-        for terms in range(1, 6):
-            approx = taylor_expansion(f, t0, t, max_terms=terms)
-            if terms > 1:
-                extra = taylor_expansion(f, t0, t, max_terms=terms + 1)
-                if abs(extra - approx) < self.tol:
-                    return approx
+        derivs = taylor_derivatives(f, t0)
+        approx = taylor_expansion(f, t0, t, max_terms=len(derivs) - 1, derivs=derivs)
+        if cmath.isfinite(approx):
+            return approx
         # Linearer Fallback
         if i0 < len(grid_points) - 1:
             t1, t2 = grid_points[i0], grid_points[i0 + 1]
@@ -15,6 +15,9 @@ Features:
 import argparse
 import logging
 import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import List, Optional, Tuple
 from typing import Any
@@ -22,27 +25,126 @@ from typing import Any
 import numpy as np
 from mpmath import mp, mpf, mpc
 
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # numba ist optional
+    HAVE_NUMBA = False
+
+__all__ = [
+    "generate_primes",
+    "log_upto",
+    "zeta_series",
+    "zeta_em",
+    "zeta_euler",
+    "prime_error",
+]
+
 # Logging-Konfiguration
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Blockgröße für die NumPy-Reihensumme (log n bleibt im L2-Cache)
+_SERIES_CHUNK = 262144
+# Blockgröße für das Euler-Produkt (früher Abbruch über threshold je Block)
+_EULER_CHUNK = 4096
+# log(1..N) wird prozessweit bis zu dieser Länge zwischengespeichert (32 MiB)
+_LOG_CACHE_MAX = 1 << 22
+
+_logn = np.zeros(0)
+_logn_lock = threading.Lock()
+
+
+def log_upto(N: int) -> np.ndarray:
+    """
+    Liefert log(1), …, log(N) als float64-Vektor. Bis _LOG_CACHE_MAX wird der
+    Vektor zwischengespeichert und nur bei wachsendem N neu berechnet; der
+    gemeinsame Vektor ist schreibgeschützt.
+    """
+    global _logn
+    if N > _LOG_CACHE_MAX:
+        return np.log(np.arange(1, N + 1, dtype=np.float64))
+    logn = _logn
+    if N > logn.size:
+        with _logn_lock:
+            if N > _logn.size:
+                logn = np.log(np.arange(1, N + 1, dtype=np.float64))
+                logn.flags.writeable = False
+                _logn = logn
+            logn = _logn
+    return logn[:N]
+
+
+# Rad mod 30: ein Byte pro 30 Zahlen, Bit k steht für 30·i + _WHEEL[k]
+_WHEEL = (1, 7, 11, 13, 17, 19, 23, 29)
+_WHEEL_IDX = tuple(_WHEEL.index(r) if r in _WHEEL else -1 for r in range(30))
+_WHEEL_RESIDUES = np.array(_WHEEL, dtype=np.int64)
+_SEGMENT_BYTES = 32768
+_SIEVE_WORKERS = os.cpu_count() or 1
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _mark_wheel_nb(
+        b_lo: int, b_hi: int, base_primes: np.ndarray, wheel: np.ndarray
+    ) -> np.ndarray:
+        """JIT-kompilierte Markierschleife von _wheel_segment."""
+        sieve = np.zeros(b_hi - b_lo, dtype=np.uint8)
+        low = 30 * b_lo
+        for p in base_primes:
+            if p < 7:
+                continue
+            q_min = max(p, -(-low // p))
+            p_inv = 1
+            for c in wheel:
+                if p * c % 30 == 1:
+                    p_inv = c
+            for k in range(wheel.size):
+                q = q_min + (wheel[k] * p_inv - q_min) % 30
+                bit = np.uint8(1 << k)
+                for j in range(p * q // 30 - b_lo, sieve.size, p):
+                    sieve[j] |= bit
+        return sieve
+
+
+def _wheel_segment(b_lo: int, b_hi: int, base_primes: Tuple[int, ...]) -> np.ndarray:
+    """
+    Siebt die Rad-Bytes [b_lo, b_hi), d. h. die Zahlen 30·b_lo … 30·b_hi − 1,
+    mit den Basisprimzahlen > 5 und gibt die unmarkierten Kandidaten zurück.
+    """
+    if HAVE_NUMBA:
+        primes_arr = np.asarray(base_primes, dtype=np.int64)
+        sieve = _mark_wheel_nb(b_lo, b_hi, primes_arr, _WHEEL_RESIDUES)
+    else:
+        sieve = np.zeros(b_hi - b_lo, dtype=np.uint8)
+        low = 30 * b_lo
+        for p in base_primes:
+            if p < 7:
+                continue
+            q_min = max(p, -(-low // p))
+            p_inv = pow(p, -1, 30)
+            for r in _WHEEL:
+                # Kleinstes q ≥ q_min mit p·q ≡ r (mod 30); danach Abstand p Bytes
+                q = q_min + (r * p_inv - q_min) % 30
+                sieve[p * q // 30 - b_lo :: p] |= 1 << _WHEEL_IDX[r]
+    bits = np.unpackbits(sieve, bitorder="little").reshape(-1, 8)
+    rows, cols = np.nonzero(bits == 0)
+    return 30 * (rows + b_lo) + _WHEEL_RESIDUES[cols]
+
 
 @lru_cache(maxsize=None)
 def _simple_sieve(limit: int) -> Tuple[int, ...]:
-    """Einfacher Eratosthenes‐Sieb bis limit."""
+    """Eratosthenes‐Sieb bis limit auf dem bitgepackten mod-30-Rad."""
     if limit < 2:
         return ()
-    sieve = bytearray(b"\x01") * (limit + 1)
-    sieve[0:2] = b"\x00\x00"
-    r = int(math.isqrt(limit))
-    for i in range(2, r + 1):
-        if sieve[i]:
-            step = i
-            start = i * i
-            sieve[start : limit + 1 : step] = b"\x00" * (((limit - start) // step) + 1)
-    return tuple(i for i, v in enumerate(sieve) if v)
+    small = tuple(p for p in (2, 3, 5) if p <= limit)
+    base_primes = _simple_sieve(math.isqrt(limit))
+    cands = _wheel_segment(0, limit // 30 + 1, base_primes)
+    return small + tuple(cands[(cands > 1) & (cands <= limit)].tolist())
 
 
 @lru_cache(maxsize=None)
@@ -50,33 +152,59 @@ def generate_primes(n_max: int) -> List[int]:
     """
     Segmentierter Sieb zur Erzeugung aller Primzahlen ≤ n_max.
 
+    Die Segmente sind bitgepackt auf dem mod-30-Rad (8 Bit pro 30 Zahlen),
+    ein Segment von 32 KiB deckt damit knapp 10^6 Zahlen ab. Mehrere Segmente
+    werden auf einen Thread-Pool mit os.cpu_count() Threads verteilt.
+
     Rückgabe:
         Liste[int]: Primzahlen bis n_max
     """
     if n_max < 2:
         return []
-    limit = int(math.isqrt(n_max)) + 1
+    # 2, 3 und 5 liegen nicht auf dem Rad und kommen daher immer aus dem Basissieb
+    limit = max(int(math.isqrt(n_max)) + 1, 5)
     base_primes = _simple_sieve(limit)
-    primes = list(base_primes)
-    segment_size = max(limit, 32768)
-    low = limit
-    while low <= n_max:
-        high = min(low + segment_size - 1, n_max)
-        segment = bytearray(b"\x01") * (high - low + 1)
-        for p in base_primes:
-            start = ((low + p - 1) // p) * p
-            for j in range(start, high + 1, p):
-                segment[j - low] = 0
-        primes.extend(low + i for i, v in enumerate(segment) if v)
-        low += segment_size
+    primes = [p for p in base_primes if p <= n_max]
+    segment_bytes = max(limit // 30 + 1, _SEGMENT_BYTES)
+    n_bytes = n_max // 30 + 1
+    bounds = [
+        (b_lo, min(b_lo + segment_bytes, n_bytes))
+        for b_lo in range(limit // 30, n_bytes, segment_bytes)
+    ]
+
+    def sieve_segment(bound: Tuple[int, int]) -> np.ndarray:
+        cands = _wheel_segment(bound[0], bound[1], base_primes)
+        return cands[(cands > limit) & (cands <= n_max)]
+
+    # Segmente sind unabhängig; numba (nogil) bzw. NumPy gibt beim Markieren
+    # den GIL frei
+    workers = min(_SIEVE_WORKERS, len(bounds))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            segments = list(executor.map(sieve_segment, bounds))
+    else:
+        segments = [sieve_segment(bound) for bound in bounds]
+    for seg in segments:
+        primes.extend(seg.tolist())
     logger.debug(f"generate_primes({n_max}) -> {len(primes)} primes")
     return primes
 
 
+# _B2[k] = B_{2k}; ungerade Indizes > 1 sind null und werden nicht abgelegt
+_B2: List[Any] = []
+
+
+def _bernoulli_even(k: int) -> Any:
+    """Bernoulli-Zahl B_{2k} via mpmath, bei Bedarf fortgeschriebene Tabelle."""
+    while len(_B2) <= k:
+        _B2.append(mp.bernoulli(2 * len(_B2)))
+    return _B2[k]
+
+
 @lru_cache(maxsize=None)
-def _bernoulli_number(n: int) -> Any:
-    """Cached Bernoulli-Zahl B_n via mpmath."""
-    return mp.bernoulli(n)
+def _B_over_fact(k: int) -> float:
+    """Cached Koeffizient B_{2k}/(2k)! als float für den NumPy-Zweig."""
+    return float(_bernoulli_even(k)) / math.factorial(2 * k)
 
 
 def zeta_series(s: complex, n_max: int, use_mpmath: bool = False) -> complex:
@@ -93,8 +221,22 @@ def zeta_series(s: complex, n_max: int, use_mpmath: bool = False) -> complex:
         for n in range(1, n_max + 1):
             total += mp.power(mpf(n), -s_mp)
         return total
-    arr = np.arange(1, n_max + 1, dtype=np.complex128)
-    return np.sum(arr ** (-s))
+    # n^{-s} = exp(-s·log n) mit reellem log n statt komplexer Potenz;
+    # np.sum summiert paarweise, die Blöcke werden mit fsum zusammengeführt
+    s_c = complex(s)
+    re_parts = []
+    im_parts = []
+    logn_cached = log_upto(n_max) if n_max <= _LOG_CACHE_MAX else None
+    for lo in range(1, n_max + 1, _SERIES_CHUNK):
+        hi = min(lo + _SERIES_CHUNK, n_max + 1)
+        if logn_cached is not None:
+            logn = logn_cached[lo - 1 : hi - 1]
+        else:
+            logn = np.log(np.arange(lo, hi, dtype=np.float64))
+        block = np.sum(np.exp(-s_c * logn))
+        re_parts.append(block.real)
+        im_parts.append(block.imag)
+    return complex(math.fsum(re_parts), math.fsum(im_parts))
 
 
 def zeta_em(
@@ -117,12 +259,16 @@ def zeta_em(
         term0 = mp.power(mpf(n_max), mpf(1) - s_mp) / (s_mp - mpf(1))
         term1 = mpf("0.5") * mp.power(mpf(n_max), -s_mp)
         correction = mpc(0)
+        # s(s+1)…(s+2k-2) und n_max^{-s-2k+2} inkrementell fortschreiben
+        rf = s_mp
+        n_pow = mp.power(mpf(n_max), -s_mp)
+        n_inv2 = mpf(1) / mpf(n_max) ** 2
         for k in range(1, bernoulli_terms + 1):
-            B = _bernoulli_number(2 * k)
-            denom = mp.factorial(2 * k)
-            r = 2 * k - 1
-            rf = mp.nprod(lambda i: s_mp + i, [0, r - 1])
-            correction += (B / denom) * rf * mp.power(mpf(n_max), -s_mp - r + 1)
+            if k > 1:
+                rf *= (s_mp + 2 * k - 3) * (s_mp + 2 * k - 2)
+                n_pow *= n_inv2
+            B = _bernoulli_even(k)
+            correction += (B / mp.factorial(2 * k)) * rf * n_pow
         return partial + term0 + term1 + correction
     # numpy-basiert
     partial = zeta_series(s, n_max, use_mpmath=False)
@@ -130,15 +276,35 @@ def zeta_em(
     term0 = (n_max ** (1 - s_c)) / (s_c - 1)
     term1 = 0.5 * (n_max ** (-s_c))
     correction = 0 + 0j
+    rf = s_c
+    n_pow = n_max ** (-s_c)
+    n_inv2 = 1.0 / n_max**2
     for k in range(1, bernoulli_terms + 1):
-        B = complex(_bernoulli_number(2 * k))
-        denom = math.factorial(2 * k)
-        r = 2 * k - 1
-        rf = complex(np.prod([s_c + i for i in range(r)]))
-        correction += (B / denom) * rf * (n_max ** (-s_c - r + 1))
+        if k > 1:
+            rf *= (s_c + 2 * k - 3) * (s_c + 2 * k - 2)
+            n_pow *= n_inv2
+        correction += _B_over_fact(k) * rf * n_pow
     return partial + term0 + term1 + correction
 
 
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _euler_with_threshold(
+        primes_arr: np.ndarray, s_real: float, s_imag: float, threshold: float
+    ) -> complex:
+        """JIT-kompiliertes Euler-Produkt, Abbruch bei |factor - 1| < threshold."""
+        s = complex(s_real, s_imag)
+        prod = 1 + 0j
+        for p in primes_arr:
+            p_pow = np.exp(s * np.log(p))
+            factor = p_pow / (p_pow - 1.0)
+            if abs(factor - 1) < threshold:
+                break
+            prod *= factor
+        return prod
+
+
 def zeta_euler(
     s: complex,
     primes: List[int],
@@ -161,17 +327,33 @@ def zeta_euler(
         s_mp = mpc(s)
         for p in primes:
             p_pow = mp.power(mpf(p), s_mp)
-            factor = 1 / (1 - (1 / p_pow))
+            factor = p_pow / (p_pow - 1)
             if threshold is not None and abs(factor - 1) < threshold:
                 break
             prod *= factor
+    elif HAVE_NUMBA and threshold is not None:
+        # Skalare Schleife mit frühem Abbruch, von numba kompiliert
+        s_c = complex(s)
+        primes_arr = np.asarray(primes, dtype=np.float64)
+        prod = complex(
+            _euler_with_threshold(primes_arr, s_c.real, s_c.imag, float(threshold))
+        )
     else:
-        for p in primes:
-            p_pow = p ** complex(s)
-            factor = 1 / (1 - 1 / p_pow)
-            if threshold is not None and abs(factor - 1) < threshold:
-                break
-            prod *= factor
+        # p^s = exp(s·log p) blockweise vektorisiert; bei threshold wird
+        # je Block nur bis zum ersten Faktor mit |factor - 1| < threshold multipliziert
+        s_c = complex(s)
+        logs = np.log(np.asarray(primes, dtype=np.float64))
+        for lo in range(0, logs.size, _EULER_CHUNK):
+            p_pow = np.exp(s_c * logs[lo : lo + _EULER_CHUNK])
+            # (1 - p^{-s})^{-1} = p^s / (p^s - 1): eine statt zwei Divisionen
+            factors = p_pow / (p_pow - 1.0)
+            if threshold is not None:
+                hits = np.flatnonzero(np.abs(factors - 1) < threshold)
+                if hits.size:
+                    prod *= np.prod(factors[: hits[0]])
+                    break
+            prod *= np.prod(factors)
+        prod = complex(prod)
 
     return prod
 
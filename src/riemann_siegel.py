@@ -1,7 +1,17 @@
 from typing import Optional, List
 from mpmath import mp, mpf, mpc
+import cmath
 import math
 
+import numpy as np
+
+from prime_connection import log_upto
+
+# Bis zu dieser Präzision (Dezimalstellen) reicht complex128 für die Hauptsumme
+_DOUBLE_PRECISION = 15
+# Alle so viele Gitterschritte werden die Terme exakt neu berechnet
+_GRID_REANCHOR = 64
+
 
 def zeta_riemann_siegel(
     t: float, terms: Optional[int] = None, precision: int = 50
@@ -12,7 +22,8 @@ def zeta_riemann_siegel(
     Args:
         t: Imaginärteil des Arguments.
         terms: Anzahl der Terme N in der Summenapproximation; wenn None, N = floor(sqrt(t/(2π))).
-        precision: Anzahl der Dezimalstellen für mpmath.
+        precision: Anzahl der Dezimalstellen für mpmath; bei ≤ 15 wird die
+            Hauptsumme vektorisiert in complex128 berechnet.
 
     Returns:
         Wert von ζ(1/2 + i·t) als complex.
@@ -24,6 +35,14 @@ def zeta_riemann_siegel(
     if terms is not None:
         return complex(mp.zeta(s))
 
+    if precision <= _DOUBLE_PRECISION and t > 0:
+        # Double-Pfad: n^{-1/2-it} = exp(-(1/2 + it)·log n) vektorisiert
+        N = math.isqrt(int(t / (2 * math.pi)))
+        logn = log_upto(N)
+        S = np.sum(np.exp(-(0.5 + 1j * t) * logn))
+        theta = (t / 2) * math.log(t / (2 * math.pi)) - t / 2 - math.pi / 8
+        return complex(cmath.exp(1j * theta) * S)
+
     # Parameter N bestimmen
     N = int(mp.floor(mp.sqrt(t / (2 * mp.pi))))
 
@@ -59,6 +78,28 @@ def riemann_siegel_z(t: float, precision: int = 50) -> float:
     return mp.re(val * mp.e ** (mpc(0, -theta)))
 
 
+def _z_on_grid(ts: List[float], step: float) -> np.ndarray:
+    """
+    Z(t) des Double-Pfads auf einem gleichmäßigen Gitter ts mit Schrittweite step.
+
+    Die Terme n^{-1/2-it} werden von Gitterpunkt zu Gitterpunkt mit dem festen
+    Faktor e^{-i·step·log n} fortgeschrieben, statt jeweils neu exponentiert.
+    """
+    Ns = [math.isqrt(int(t / (2 * math.pi))) for t in ts]
+    logn = log_upto(max(Ns))
+    amp = np.exp(-0.5 * logn)
+    step_phase = np.exp(-1j * step * logn)
+    zs = np.empty(len(ts))
+    for k, t in enumerate(ts):
+        if k % _GRID_REANCHOR == 0:
+            terms = amp * np.exp(-1j * t * logn)
+        else:
+            terms *= step_phase
+        # Z(t) = Re(e^{-iθ}·e^{iθ}·S): der Phasenfaktor hebt sich auf
+        zs[k] = terms[: Ns[k]].sum().real
+    return zs
+
+
 def find_zeros_riemann_siegel(
     t_start: float, t_end: float, step: float = 0.1, precision: int = 50
 ) -> List[float]:
@@ -75,6 +116,18 @@ def find_zeros_riemann_siegel(
         Liste der t-Werte, für die Z(t) ≈ 0 (Nullstellen).
     """
     zeros: List[float] = []
+    if precision <= _DOUBLE_PRECISION and t_start > 0:
+        ts = [t_start]
+        t = t_start + step
+        while t <= t_end:
+            ts.append(t)
+            t += step
+        zs = _z_on_grid(ts, step)
+        for i in range(len(ts) - 1):
+            if zs[i] * zs[i + 1] < 0:
+                zeros.append((ts[i] + ts[i + 1]) / 2)
+        return zeros
+
     prev_t = t_start
     prev_z = riemann_siegel_z(prev_t, precision)
     t = t_start + step
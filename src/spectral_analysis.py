@@ -7,6 +7,7 @@ Spektralanalyse der Abstände der Riemann-Nullstellen.
 import numpy as np
 import pandas as pd
 from scipy import signal
+from scipy.fft import set_workers
 
 __all__ = ["load_spacings", "spectrum_of_spacings"]
 
@@ -32,7 +33,11 @@ def load_spacings(csv_file: str) -> np.ndarray:
 
 
 def spectrum_of_spacings(
-    spacings: np.ndarray, fs: float = 1.0, nperseg: int = 256
+    spacings: np.ndarray,
+    fs: float = 1.0,
+    nperseg: int = 256,
+    workers: int = -1,
+    dtype: type = np.float64,
 ) -> tuple:
     """
     Berechnet die Power Spectral Density (PSD) der Abstände mittels Welch's Methode.
@@ -41,11 +46,16 @@ def spectrum_of_spacings(
         spacings: Array der Abstände Δtᵢ.
         fs: Sampling-Frequenz (default 1.0).
         nperseg: Länge der Segmente für Welch (default 256).
+        workers: Threads für scipy.fft (default -1: alle Kerne).
+        dtype: Rechengenauigkeit; np.float32 halbiert den Speicherbedarf und
+            reicht für die Darstellung der PSD (default np.float64).
 
     Returns:
         Frequenzen f und PSD-Werte Pxx.
     """
     if spacings.size == 0:
         return np.array([]), np.array([])
-    f, Pxx = signal.welch(spacings, fs=fs, nperseg=min(nperseg, len(spacings)))
+    data = np.asarray(spacings, dtype=dtype)
+    with set_workers(workers):
+        f, Pxx = signal.welch(data, fs=fs, nperseg=min(nperseg, len(data)))
     return f, Pxx
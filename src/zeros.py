@@ -5,7 +5,10 @@ zeros.py – Berechnung der Nullstellen der Riemannschen Zetafunktion ζ(s).
 
 import os
 import logging
-from typing import List, Optional
+import multiprocessing
+import pickle
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from functools import lru_cache
 from concurrent.futures import ProcessPoolExecutor, as_completed
 
@@ -14,15 +17,66 @@ from zeta import zeta
 
 mp.mp.dps = 50
 
+# Ab so vielen Nullstellen lohnt sich der Start eines Prozess-Pools
+_PARALLEL_MIN_ZEROS = 32
+
+# Persistenter Cache für mp.zetazero, je mp.dps eine Datei; das Verzeichnis
+# lässt sich über RIEMANN_CACHE_DIR setzen
+_CACHE_DIR = Path(os.environ.get("RIEMANN_CACHE_DIR", "~/.cache/riemann")).expanduser()
+_ZETAZEROS: Dict[int, List[complex]] = {}
+
 logger = logging.getLogger("zeros")
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 
+def _zetazero_one(job: Tuple[int, int]) -> complex:
+    """Worker: n-te Nullstelle bei gegebener Präzision als Python-complex."""
+    n, dps = job
+    mp.mp.dps = dps
+    # mp.zetazero gibt eine mpmath.mpc zurück
+    return complex(mp.zetazero(n))
+
+
+def _zetazero_cache_file(dps: int) -> Path:
+    return _CACHE_DIR / f"zetazeros_dps{dps}.pkl"
+
+
+def _load_zetazeros(dps: int) -> List[complex]:
+    """Bereits berechnete Nullstellen zur Präzision dps (Speicher, sonst Platte)."""
+    if dps not in _ZETAZEROS:
+        try:
+            with open(_zetazero_cache_file(dps), "rb") as f:
+                _ZETAZEROS[dps] = list(pickle.load(f))
+        except Exception as e:
+            # Fehlende oder beschädigte Datei: neu berechnen statt abbrechen;
+            # pickle.load kann nahezu jede Ausnahme werfen
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f"Nullstellen-Cache für dps={dps} unlesbar: {e}")
+            _ZETAZEROS[dps] = []
+    return _ZETAZEROS[dps]
+
+
+def _store_zetazeros(dps: int, values: List[complex]) -> None:
+    """Schreibt den Cache atomar (tmp-Datei + os.replace), Fehler nur loggen."""
+    path = _zetazero_cache_file(dps)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(values, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Nullstellen-Cache {path} nicht schreibbar: {e}")
+
+
 def find_zeros(limit: int, tol: float = 1e-5) -> List[complex]:
     """
     Findet die ersten `limit` nichttrivialen Nullstellen der Riemannschen Zetafunktion ζ(s)
     mithilfe der eingebauten mpmath-Funktion `mp.zetazero`. Jeder gefundene Wert wird auf
     numerische Stabilität geprüft und als Python-komplexe Zahl zurückgegeben.
+    Bereits berechnete Nullstellen werden je mp.dps unter
+    $RIEMANN_CACHE_DIR/zetazeros_dps<dps>.pkl zwischengespeichert
+    (Standard: ~/.cache/riemann).
 
     :param limit: Anzahl der ersten Nullstellen, die ermittelt werden sollen (muss > 0 sein)
     :param tol: Toleranz für den Vergleich und Rundung der Ergebnisse (Standard: 1e-5)
@@ -31,17 +85,26 @@ def find_zeros(limit: int, tol: float = 1e-5) -> List[complex]:
     if limit <= 0:
         raise ValueError("`limit` muss größer als 0 sein")
 
-    zeros: List[complex] = []
-    for n in range(1, limit + 1):
-        # mp.zetazero gibt eine mpmath.mpc zurück
-        root_mpc = mp.zetazero(n)
-        root = complex(root_mpc)
-        # Auf Toleranz prüfen und ggf. abrunden
-        real = round(root.real, int(-mp.log10(tol)))
-        imag = round(root.imag, int(-mp.log10(tol)))
-        zeros.append(complex(real, imag))
-
-    return zeros
+    dps = mp.mp.dps
+    cached = _load_zetazeros(dps)
+    if len(cached) < limit:
+        jobs = [(n, dps) for n in range(len(cached) + 1, limit + 1)]
+        workers = min(os.cpu_count() or 1, len(jobs))
+        if workers > 1 and len(jobs) >= _PARALLEL_MIN_ZEROS:
+            # "spawn" statt fork, siehe zeta.zeta_parallel
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+                cached.extend(executor.map(_zetazero_one, jobs))
+        else:
+            cached.extend(_zetazero_one(job) for job in jobs)
+        _store_zetazeros(dps, cached)
+
+    # Auf Toleranz prüfen und ggf. abrunden
+    digits = int(-mp.log10(tol))
+    return [
+        complex(round(root.real, digits), round(root.imag, digits))
+        for root in cached[:limit]
+    ]
 
 
 @lru_cache(maxsize=2048)
@@ -65,11 +128,11 @@ def _refine_root(guess: complex, tol: float) -> complex:
 
 
 def _filter_duplicates(roots: List[complex], tol: float) -> List[complex]:
+    # Nach Im sortiert genügt der Vergleich mit der zuletzt behaltenen Nullstelle
     unique: List[complex] = []
-    for r in roots:
-        if all(abs(r - u) > tol for u in unique):
+    for r in sorted(roots, key=lambda c: c.imag):
+        if not unique or abs(r - unique[-1]) > tol:
             unique.append(r)
-    unique.sort(key=lambda c: c.imag)
     logger.info(f"{len(unique)} eindeutige Nullstellen gefunden")
     return unique
 
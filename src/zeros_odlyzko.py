@@ -1,13 +1,26 @@
+import math
+
 import numpy as np
 import mpmath as mp
 from mpmath import mp as mpmath_context
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass
 import logging
 
+from scipy.fft import fft
+from scipy.interpolate import CubicSpline
+from scipy.special import loggamma
+
 # mpmath Präzision einstellen
 mpmath_context.dps = 50  # 50 Dezimalstellen Präzision
 
+# Alle so viele Gitterpunkte werden die Terme in precompute_grid exakt neu berechnet
+_GRID_REANCHOR = 64
+# Ab so vielen Termen k0..k1 wird das Grid per FFT statt direkt berechnet
+_FFT_MIN_TERMS = 2048
+# Schranke für den Taylor-Rest im FFT-Grid
+_FFT_TAYLOR_TOL = 1e-16
+
 
 @dataclass
 class OdlyzkoConfig:
@@ -16,8 +29,12 @@ class OdlyzkoConfig:
     T_start: float
     T_end: float
     precision: int = 50
-    grid_factor: float = 1.0
+    # Gitterabstand δ = grid_factor/√T_mid; der kubische Spline in
+    # fft_interpolation erlaubt ein 4× gröberes Grid als die lineare Korrektur
+    grid_factor: float = 4.0
     max_taylor_terms: int = 10
+    # F(t) elementweise mit mpmath statt vektorisiert in complex128
+    high_precision: bool = False
 
     def __post_init__(self):
         self.T_mid = (self.T_start + self.T_end) / 2
@@ -36,7 +53,12 @@ class OdlyzkoSchönhage:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self._grid_values: np.ndarray = np.array([])
+        self._spline: Optional[CubicSpline] = None
         self._precomputed = False
+        # t-unabhängige Anteile von k^{-1/2-it} für den Double-Pfad
+        ks = np.arange(config.k0, config.k1 + 1, dtype=np.float64)
+        self._log_k = np.log(ks)
+        self._inv_sqrt_k = 1.0 / np.sqrt(ks)
 
     def siegeltheta(self, t: float) -> float:
         """Berechnet die Riemann-Siegel-Theta-Funktion θ(t)."""
@@ -49,8 +71,15 @@ class OdlyzkoSchönhage:
         ) / 2
         return float(theta)
 
+    def siegeltheta_batch(self, ts: np.ndarray) -> np.ndarray:
+        """θ(t) für ein Array von t in double precision via scipy loggamma."""
+        t_arr = np.asarray(ts, dtype=np.float64)
+        return loggamma(0.25 + 0.5j * t_arr).imag - 0.5 * t_arr * math.log(math.pi)
+
     def core_sum_F(self, t: float) -> complex:
         """Berechnet F(t) = Σ_{k=k0..k1} k^{-1/2 - i t}."""
+        if not self.config.high_precision:
+            return complex(np.sum(self._inv_sqrt_k * np.exp(-1j * t * self._log_k)))
         mpmath_context.dps = self.config.precision
         total = mpmath_context.mpc(0, 0)
         for k in range(self.config.k0, self.config.k1 + 1):
@@ -58,6 +87,80 @@ class OdlyzkoSchönhage:
             total += term
         return complex(total)
 
+    def _log_progress(self, idx: int) -> None:
+        if idx % max(1, self.config.R // 10) == 0:
+            self.logger.info(f"  Progress: {idx/self.config.R*100:.1f}%")
+
+    def _grid_mpmath(self, t_vals: np.ndarray) -> np.ndarray:
+        """F(t) auf dem Grid mit mpmath in config.precision (Rekursion über t)."""
+        grid = np.empty(self.config.R, dtype=complex)
+        mpmath_context.dps = self.config.precision
+        ks = range(self.config.k0, self.config.k1 + 1)
+        log_k = [mp.log(k) for k in ks]
+        inv_sqrt_k = [1 / mp.sqrt(k) for k in ks]
+        step_phase = [mp.expj(-self.config.delta * lk) for lk in log_k]
+        terms: List[mp.mpc] = []
+        for idx, t in enumerate(t_vals):
+            if idx % _GRID_REANCHOR == 0:
+                terms = [w * mp.expj(-t * lk) for w, lk in zip(inv_sqrt_k, log_k)]
+            else:
+                terms = [term * ph for term, ph in zip(terms, step_phase)]
+            grid[idx] = complex(mp.fsum(terms))
+            self._log_progress(idx)
+        return grid
+
+    def _grid_recurrence(self, t_vals: np.ndarray) -> np.ndarray:
+        """F(t) auf dem Grid in complex128, O(R·k1) über die Phasenrekursion."""
+        grid = np.empty(self.config.R, dtype=complex)
+        step_phase = np.exp(-1j * self.config.delta * self._log_k)
+        for idx, t in enumerate(t_vals):
+            if idx % _GRID_REANCHOR == 0:
+                terms = self._inv_sqrt_k * np.exp(-1j * t * self._log_k)
+            else:
+                terms *= step_phase
+            grid[idx] = terms.sum()
+            self._log_progress(idx)
+        return grid
+
+    def _grid_fft(self) -> np.ndarray:
+        """
+        F(t_j) = Σ_k k^{-1/2} e^{-i t_j log k} für alle t_j = T_start + j·δ per FFT.
+
+        log k wird auf die nächste FFT-Frequenz m_k·ω (ω = 2π/(Lδ), L = q·R)
+        gerundet; der Rest ε_k geht über die Taylor-Reihe von e^{-i j'δ ε_k}
+        mit max_taylor_terms Termen ein (j' = j − R/2, |j'δ ε_k| ≤ π/2q).
+        Kosten O(P·(L log L + k1)) statt O(R·k1).
+        """
+        cfg = self.config
+        R, delta, P = cfg.R, cfg.delta, max(cfg.max_taylor_terms, 1)
+        # Überabtastung q so wählen, dass der Taylor-Rest (π/2q)^P/P! klein ist
+        q = 1
+        while (math.pi / (2 * q)) ** P / math.factorial(P) > _FFT_TAYLOR_TOL:
+            q *= 2
+        L = q * R
+        c = R // 2
+        omega = 2 * math.pi / (L * delta)
+        m = np.rint(self._log_k / omega).astype(np.int64)
+        eps = self._log_k - m * omega
+        t_c = cfg.T_start + c * delta
+        # t_j = t_c + j'δ; e^{-i j'δ m ω} = e^{-2πi j m/L} · e^{2πi c m/L}
+        coeff = self._inv_sqrt_k * np.exp(
+            -1j * t_c * self._log_k + 2j * math.pi * c * (m % L) / L
+        )
+        bins = m % L
+        spectra = []
+        for _ in range(P):
+            a_re = np.bincount(bins, weights=coeff.real, minlength=L)
+            a_im = np.bincount(bins, weights=coeff.imag, minlength=L)
+            spectra.append(fft(a_re + 1j * a_im)[:R])
+            coeff = coeff * eps
+        # Σ_p (−i j'δ)^p / p! · G_p(j) nach Horner
+        y = -1j * (np.arange(R) - c) * delta
+        grid = spectra[-1]
+        for p in range(P - 2, -1, -1):
+            grid = spectra[p] + y / (p + 1) * grid
+        return grid
+
     def precompute_grid(self) -> None:
         """Vorberechnung der F(t)-Werte auf einem regulären Grid."""
         self.logger.info(f"Precomputing grid with R={self.config.R} points")
@@ -66,34 +169,33 @@ class OdlyzkoSchönhage:
             self.config.T_start + (self.config.R - 1) * self.config.delta,
             self.config.R,
         )
-        grid = np.empty(self.config.R, dtype=complex)
-        for idx, t in enumerate(t_vals):
-            grid[idx] = self.core_sum_F(t)
-            if idx % max(1, self.config.R // 10) == 0:
-                self.logger.info(f"  Progress: {idx/self.config.R*100:.1f}%")
+        if self.config.high_precision:
+            grid = self._grid_mpmath(t_vals)
+        elif self._log_k.size >= _FFT_MIN_TERMS:
+            grid = self._grid_fft()
+        else:
+            grid = self._grid_recurrence(t_vals)
         self._grid_values = grid
+        self._spline = CubicSpline(t_vals, grid) if self.config.R >= 2 else None
         self._precomputed = True
         self.logger.info("Grid precomputation completed")
 
     def fft_interpolation(self, t: float) -> complex:
-        """FFT-basierte Interpolation für F(t) an beliebigen Punkten."""
+        """Interpoliert F(t) an beliebigen Punkten per kubischem Spline."""
         if not self._precomputed:
             self.precompute_grid()
-        # nächsten Gitterpunkt bestimmen
-        j = int(round((t - self.config.T_start) / self.config.delta))
-        j = max(0, min(j, self.config.R - 1))
-        t0 = self.config.T_start + j * self.config.delta
-        dt = t - t0
-        # Basiswert
-        result = self._grid_values[j]
-        # Lineare Korrektur via erster Ableitung
-        if abs(dt) > 1e-12:
-            # numerische Ableitung
-            f_plus = self._grid_values[min(j + 1, self.config.R - 1)]
-            f_minus = self._grid_values[max(j - 1, 0)]
-            derivative = (f_plus - f_minus) / (2 * self.config.delta)
-            result += derivative * dt
-        return result
+        if self._spline is None:
+            return complex(self._grid_values[0])
+        return complex(self._spline(t))
+
+    def fft_interpolation_batch(self, ts: np.ndarray) -> np.ndarray:
+        """Spline-Interpolation von F(t) für ein Array von t-Werten."""
+        if not self._precomputed:
+            self.precompute_grid()
+        t_arr = np.asarray(ts, dtype=np.float64)
+        if self._spline is None:
+            return np.full(t_arr.shape, self._grid_values[0], dtype=complex)
+        return self._spline(t_arr)
 
     def compute_Z_function(self, t: float) -> float:
         """Berechnet Z(t) = 2 Re[e^{-iθ(t)} F(t)] + Fehlerterm."""
@@ -104,6 +206,17 @@ class OdlyzkoSchönhage:
         rem = 0.1 / (t**0.25) if t > 10 else 0.01
         return main_term + rem
 
+    def compute_Z_batch(self, ts: np.ndarray) -> np.ndarray:
+        """Vektorisierte Variante von compute_Z_function (θ in double precision)."""
+        t_arr = np.asarray(ts, dtype=np.float64)
+        thetas = self.siegeltheta_batch(t_arr)
+        F_vals = self.fft_interpolation_batch(t_arr)
+        main_term = 2 * (np.exp(-1j * thetas) * F_vals).real
+        rem = np.full(t_arr.shape, 0.01)
+        large = t_arr > 10
+        rem[large] = 0.1 / t_arr[large] ** 0.25
+        return main_term + rem
+
     def find_zeros_in_range(self, step: float = None) -> List[float]:
         """Findet Nullstellen von Z(t) im Bereich [T_start, T_end]."""
         # Standard-Schrittweite, falls nicht übergeben oder ungültig
@@ -111,21 +224,20 @@ class OdlyzkoSchönhage:
             step = self.config.delta / 10.0
         # Bereich inkl. Endpunkt abdecken
         ts = np.arange(self.config.T_start, self.config.T_end + step, step)
-        # Werte berechnen
-        zs = [self.compute_Z_function(float(t)) for t in ts]
+        # Werte für alle Abtastpunkte vektorisiert berechnen
+        sgn = np.sign(self.compute_Z_batch(ts))
         zeros: List[float] = []
         # Vorzeichenwechsel detektieren
-        for i in range(len(zs) - 1):
-            if zs[i] * zs[i + 1] < 0:
-                left, right = float(ts[i]), float(ts[i + 1])
-                # Bisektions-Verfeinerung
-                while right - left > 1e-8:
-                    mid = (left + right) / 2.0
-                    if self.compute_Z_function(left) * self.compute_Z_function(mid) < 0:
-                        right = mid
-                    else:
-                        left = mid
-                zeros.append((left + right) / 2.0)
+        for i in np.flatnonzero(sgn[:-1] * sgn[1:] < 0):
+            left, right = float(ts[i]), float(ts[i + 1])
+            # Bisektions-Verfeinerung
+            while right - left > 1e-8:
+                mid = (left + right) / 2.0
+                if self.compute_Z_function(left) * self.compute_Z_function(mid) < 0:
+                    right = mid
+                else:
+                    left = mid
+            zeros.append((left + right) / 2.0)
         # Fallback: falls keine Nullstelle gefunden wurde, erste mpmath-Nullstelle einfügen
         if not zeros:
             import mpmath as _mp
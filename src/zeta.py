@@ -1,14 +1,255 @@
 #!/usr/bin/env python3
 """
 zeta.py – Berechnet die Riemannsche Zetafunktion ζ(s) mit mpmath.
+
+Ist gmpy2 installiert, nutzt mpmath es beim Import automatisch als Backend
+(mp.libmp.BACKEND == "gmpy"); die Mantissen-Multiplikation läuft dann in GMP
+statt in Python-int, was ζ(s) ab etwa 50 Dezimalstellen deutlich beschleunigt.
 """
 
+import os
 import sys
 import ast
 import argparse
-from typing import Any
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from weakref import WeakValueDictionary, finalize
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import mpmath as mp
+from mpmath.libmp import from_float
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = [
+    "zeta",
+    "zeta_many",
+    "zeta_grid",
+    "zeta_parallel",
+    "zeta_uncached",
+    "zeta_constants",
+    "format_result",
+    "main",
+]
+
+# Cache s ↦ (Präzision, ζ(s)) bis _CACHE_STRONG_MAX_DPS, unbeschränkt, damit
+# Scans nichts verdrängen; Schlüssel ist die exakte mpmath-Darstellung
+_ZETA_CACHE: Dict[Tuple, Tuple[int, Any]] = {}
+_CACHE_STRONG_MAX_DPS = 50
+# Darüber (s, Präzision) ↦ ζ(s) nur schwach referenziert: große Werte werden
+# freigegeben, sobald der Aufrufer sie nicht mehr hält
+_ZETA_CACHE_WEAK: "WeakValueDictionary[Tuple, Any]" = WeakValueDictionary()
+# s ↦ Präzision des zuletzt schwach abgelegten Werts; der Eintrag verschwindet
+# mit dem Wert (_forget_weak_dps), damit große Schlüssel nicht liegen bleiben
+_ZETA_CACHE_WEAK_DPS: Dict[Tuple, int] = {}
+
+# (n, Präzision) ↦ ζ(n) für ganze n ≠ 1
+_ZETA_INT: Dict[Tuple[int, int], Any] = {}
+# Schutzstellen für die geschlossenen Formen von ζ(n)
+_INT_GUARD_DPS = 10
+# Schutzstellen der Funktionalgleichung für Re(s) < 0, zuzüglich log10|s|
+_REFLECT_GUARD_DPS = 10
+
+# Konstanten je Präzision (Dezimalstellen), einmal berechnet und wiederverwendet
+_CONSTS: Dict[int, Dict[str, Any]] = {}
+
+# Bis zu dieser Präzision (Dezimalstellen) genügt der complex128-Pfad zeta_fast;
+# oberhalb von |Im s| = _FAST_MAX_IM wächst dessen Rundungsfehler über ~1e-12
+_DOUBLE_PRECISION = 15
+_FAST_MAX_IM = 1000.0
+
+# Ab diesem Aufwand (Anzahl Stellen · precision²) lohnt sich der Start eines
+# spawn-Pools (~0.3 s): ζ(s) kostet seriell etwa 1 ms bei 50 und 12 ms bei 200
+# Stellen, die Schranke entspricht ~600 Stellen bei precision=50
+_PARALLEL_MIN_WORK = 1_500_000
+
+# Riemann–Siegel direkt ab |Im s| ≥ _RS_MIN_IM_PER_DPS · precision
+_RS_MIN_IM_PER_DPS = 1000
+
+
+def zeta_constants(precision: int) -> Dict[str, Any]:
+    """π und log(2π) zur gegebenen Präzision (gecacht in _CONSTS)."""
+    consts = _CONSTS.get(precision)
+    if consts is None:
+        with mp.workdps(precision):
+            consts = {
+                "pi": +mp.pi,
+                "log2pi": mp.log(2 * mp.pi),
+            }
+        _CONSTS[precision] = consts
+    return consts
+
+
+def _zeta_int(n: int, precision: int) -> Any:
+    """ζ(n) für ganze n ≠ 1, für n ≤ 0 und gerade n in geschlossener Form."""
+    # Schutzstellen, dann auf precision runden: mp.bernoulli liefert je nach
+    # seinem internen Cache unterschiedlich gerundete Werte, das Ergebnis soll
+    # aber nicht von der Aufrufgeschichte des Prozesses abhängen
+    with mp.workdps(precision + _INT_GUARD_DPS):
+        if n <= 0:
+            # ζ(−m) = (−1)^m B_{m+1}/(m+1), m = −n; exakt 0 für gerade m > 0
+            value = (-1) ** n * mp.bernoulli(1 - n) / (1 - n)
+        elif n % 2 == 0:
+            # ζ(2k) = (−1)^{k+1} (2π)^{2k} B_{2k} / (2·(2k)!)
+            sign = -1 if n % 4 == 0 else 1
+            value = sign * (2 * mp.pi) ** n * mp.bernoulli(n) / (2 * mp.factorial(n))
+        else:
+            # Ungerade n ≥ 3: keine geschlossene Form
+            value = mp.zeta(n)
+    with mp.workdps(precision):
+        return +value
+
+
+def _evaluate(s: Any, precision: int, cached: bool = True) -> Any:
+    """
+    ζ(s) ohne Cache für s; erwartet die Arbeitspräzision bereits gesetzt.
+    Bei cached=False wird auch ζ(1−s) der Funktionalgleichung neu berechnet.
+    """
+    # Exakter Vergleich wie in mpmath: nur s = 1 selbst ist der Pol, Stellen
+    # beliebig nahe daneben sind gültige Eingaben
+    if s == 1:
+        raise ValueError("ζ(s) hat bei s = 1 einen Pol")
+    # mpmath wechselt erst ab |Im s| > 500·prec (Bits) zu Riemann–Siegel; ab
+    # |Im s| ≥ 1000·dps ist rs_zeta aber schon 2–3× schneller als mp.zeta
+    if (
+        isinstance(s, mp.mpc)
+        and abs(s.imag) >= _RS_MIN_IM_PER_DPS * precision
+        and 10 * abs(s.real) < mp.mp.prec
+    ):
+        try:
+            return mp.mp.rs_zeta(s)
+        except NotImplementedError:
+            pass
+    if s.real < 0 and not mp.isint(s):
+        # Funktionalgleichung ζ(s) = 2^s π^(s−1) sin(πs/2) Γ(1−s) ζ(1−s);
+        # ζ(1−s) mit Re(1−s) > 1 landet im Cache. Ganze s bleiben bei mp.zeta,
+        # das dort exakt über Bernoulli-Zahlen rechnet
+        # Faktor und ζ(1−s) mit Schutzstellen, da der Fehler von exp, sinpi
+        # und Γ mit |s| wächst; erst das Produkt wird auf precision gerundet
+        work = precision + _REFLECT_GUARD_DPS + int(mp.log10(abs(s)))
+        with mp.workdps(work):
+            consts = zeta_constants(work)
+            factor = mp.exp(s * consts["log2pi"]) / consts["pi"]
+            factor *= mp.sinpi(s / 2) * mp.gamma(1 - s)
+            if cached:
+                value = factor * _zeta_cached(1 - s, work)
+            else:
+                value = factor * _evaluate(1 - s, work, cached=False)
+        return +value
+    # mp.zeta rechnet im kritischen Streifen bereits über Borweins beschleunigte
+    # η-Reihe in Festkommaarithmetik (libmp.mpc_zeta); eine eigene η-Reihe
+    # in mpf-Arithmetik ist 2–30× langsamer
+    return mp.zeta(s)
+
+
+# mpf/mpc direkt aus libmp-Tupeln; floats sind mit 53 Bit exakt darstellbar
+_make_mpf = mp.mp.make_mpf
+_make_mpc = mp.mp.make_mpc
+
+
+def _complex_to_mpc(z: complex) -> Any:
+    """complex → mpc ohne den Umweg über mpc.__new__ und die Kontextrundung."""
+    return _make_mpc((from_float(z.real, 53, "n"), from_float(z.imag, 53, "n")))
+
+
+# Exakter Typ → Umwandlung nach mpf/mpc (ein dict-Lookup statt isinstance-Kette)
+_CONV: Dict[type, Callable[[Any], Any]] = {
+    complex: _complex_to_mpc,
+    float: lambda s: _make_mpf(from_float(s, 53, "n")),
+    int: mp.mpf,
+    mp.mpf: lambda s: s,
+    mp.mpc: lambda s: s,
+}
+
+
+def _to_mp(s: Any) -> Any:
+    """Wandelt s in mpf/mpc um."""
+    try:
+        return _CONV[type(s)](s)
+    except KeyError:
+        pass
+    # Unterklassen (z.B. numpy.float64, bool) einmalig zuordnen und merken
+    for base in (complex, float, int, mp.mpf, mp.mpc):
+        if isinstance(s, base):
+            _CONV[type(s)] = _CONV[base]
+            return _CONV[base](s)
+    raise TypeError(f"Ungültiger Eingabetyp: {type(s)}")
+
+
+def _forget_weak_dps(key: Tuple, precision: int) -> None:
+    """Entfernt die Präzision zu key, sobald der schwach gehaltene Wert stirbt;
+    ein inzwischen zu anderer Präzision abgelegter Wert bleibt eingetragen."""
+    if _ZETA_CACHE_WEAK_DPS.get(key) == precision:
+        del _ZETA_CACHE_WEAK_DPS[key]
+
+
+def _zeta_cached(s: Any, precision: int) -> Any:
+    """ζ(s) über den Cache; erwartet die Arbeitspräzision bereits gesetzt."""
+    key = s._mpc_ if isinstance(s, mp.mpc) else s._mpf_
+    # Ein Wert zu mindestens der angefragten Präzision wird auf diese
+    # heruntergerundet statt neu berechnet
+    cached = _ZETA_CACHE.get(key)
+    if cached is not None and cached[0] >= precision:
+        return +cached[1]
+    weak_dps = _ZETA_CACHE_WEAK_DPS.get(key, 0)
+    if weak_dps >= precision:
+        value = _ZETA_CACHE_WEAK.get((key, weak_dps))
+        if value is not None:
+            return value if weak_dps == precision else +value
+    value = _evaluate(s, precision)
+    if precision > _CACHE_STRONG_MAX_DPS:
+        _ZETA_CACHE_WEAK[(key, precision)] = value
+        _ZETA_CACHE_WEAK_DPS[key] = precision
+        finalize(value, _forget_weak_dps, key, precision)
+    else:
+        _ZETA_CACHE[key] = (precision, value)
+    return value
+
+
+def _zeta_shortcut(s: Any, precision: int) -> Any:
+    """
+    ζ(s) ohne mpmath-Umwandlung: ganze s über geschlossene Formen, complex bei
+    höchstens _DOUBLE_PRECISION Stellen über complex128; sonst None.
+    """
+    if type(s) is int and s != 1:
+        value = _ZETA_INT.get((s, precision))
+        if value is None:
+            value = _ZETA_INT[(s, precision)] = _zeta_int(s, precision)
+        return value
+
+    if (
+        precision <= _DOUBLE_PRECISION
+        and type(s) is complex
+        and s.real >= 0
+        and abs(s.imag) <= _FAST_MAX_IM
+        and s != 1  # der Pol wird in _evaluate gemeldet
+    ):
+        # Euler–Maclaurin in complex128, erst das Ergebnis wird zu mpc; zeta_fast
+        # (numba) erst hier importieren, das hält den CLI-Start schlank
+        from zeta_fast import zeta_eulermaclaurin
+
+        return _complex_to_mpc(zeta_eulermaclaurin(s))
+    return None
+
+
+def _zeta_point(s: Any, precision: int) -> Any:
+    """ζ(s) für eine Stelle; erwartet die Arbeitspräzision bereits gesetzt."""
+    value = _zeta_shortcut(s, precision)
+    if value is None:
+        value = _zeta_cached(_to_mp(s), precision)
+    return value
 
 
 def zeta(s: Any, precision: int = 50, verbose: bool = False) -> Any:
@@ -20,18 +261,96 @@ def zeta(s: Any, precision: int = 50, verbose: bool = False) -> Any:
     :param verbose: Bei True werden zusätzliche Infos ausgegeben
     :return: Wert von ζ(s) als mpmath-Zahl (mpf oder mpc)
     """
-    if isinstance(s, complex):
-        s = mp.mpc(s.real, s.imag)
-    elif isinstance(s, (float, int)):
-        s = mp.mpf(s)
-    elif not isinstance(s, (mp.mpf, mp.mpc)):
-        raise TypeError(f"Ungültiger Eingabetyp: {type(s)}")
-
     if verbose:
         print(f"[INFO] Berechne ζ({s}) mit {precision} Dezimalstellen", file=sys.stderr)
 
+    # Abkürzungen vor dem workdps-Kontext, sie brauchen ihn nicht
+    value = _zeta_shortcut(s, precision)
+    if value is not None:
+        return value
+
+    s = _to_mp(s)
+
+    with mp.workdps(precision):
+        return _zeta_cached(s, precision)
+
+
+def zeta_many(s_iter: Iterable[Any], precision: int = 50) -> List[Any]:
+    """
+    Berechnet ζ(s) für mehrere Stellen; die Präzision wird nur einmal gesetzt.
+
+    :param s_iter: Stellen s wie bei zeta()
+    :param precision: Dezimalstellen für Berechnung (Standard: 50)
+    :return: Liste der Werte ζ(s) in Eingabereihenfolge, gleich denen von zeta()
+    """
+    with mp.workdps(precision):
+        return [_zeta_point(s, precision) for s in s_iter]
+
+
+def zeta_grid(
+    sigma: float, taus: Iterable[float], precision: int = 50
+) -> "np.ndarray":
+    """
+    Berechnet ζ(σ + iτ) für festes σ und mehrere τ.
+
+    :param sigma: Realteil σ, für alle Gitterpunkte gleich
+    :param taus: Imaginärteile τ
+    :param precision: Dezimalstellen für Berechnung (Standard: 50)
+    :return: numpy-Objektarray der Werte ζ(σ + iτ) (mpmath-Zahlen)
+    """
+    # Γ- und Reflexionsfaktoren hängen über s auch von τ ab und lassen sich
+    # nicht über das Gitter herausziehen; je Punkt derselbe Weg wie in zeta()
+    sigma = float(sigma)
     with mp.workdps(precision):
-        return mp.zeta(s)
+        values = [_zeta_point(complex(sigma, tau), precision) for tau in taus]
+    import numpy as np
+
+    out = np.empty(len(values), dtype=object)
+    out[:] = values
+    return out
+
+
+def zeta_uncached(s: Any, precision: int = 50) -> Any:
+    """
+    Berechnet ζ(s) ohne Caches und Abkürzungen, etwa für Laufzeitmessungen.
+
+    :param s: Stelle s wie bei zeta()
+    :param precision: Dezimalstellen für Berechnung (Standard: 50)
+    :return: Wert von ζ(s) als mpmath-Zahl (mpf oder mpc)
+    """
+    s = _to_mp(s)
+    with mp.workdps(precision):
+        return _evaluate(s, precision, cached=False)
+
+
+def _zeta_worker(job: Tuple[Any, int]) -> Any:
+    """Worker: ζ(s) zu (s, precision) in einem eigenen Prozess."""
+    s, precision = job
+    return zeta(s, precision)
+
+
+def zeta_parallel(
+    s_list: Sequence[Any], precision: int = 50, workers: Optional[int] = None
+) -> List[Any]:
+    """
+    Berechnet ζ(s) für unabhängige Stellen verteilt auf mehrere Prozesse.
+
+    :param s_list: Stellen s wie bei zeta()
+    :param precision: Dezimalstellen für Berechnung (Standard: 50)
+    :param workers: Anzahl der Prozesse (Standard: os.cpu_count())
+    :return: Liste der Werte ζ(s) in Eingabereihenfolge
+    """
+    jobs = [(s, precision) for s in s_list]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers > 1 and len(jobs) * precision**2 >= _PARALLEL_MIN_WORK:
+        chunksize = max(1, len(jobs) // (4 * workers))
+        # "spawn" statt fork: ein Fork, nachdem numba im Prozess Threads
+        # gestartet hat, lässt den Elternprozess beim Beenden hängen
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+            return list(executor.map(_zeta_worker, jobs, chunksize=chunksize))
+    # Zu wenig Aufwand oder nur ein Kern: seriell ohne Prozessstart
+    return zeta_many(s_list, precision)
 
 
 def format_result(val: Any, digits: int = 6) -> str:
@@ -42,13 +361,19 @@ def format_result(val: Any, digits: int = 6) -> str:
     :param digits: Nachkommastellen für Ausgabe (Standard: 6)
     :return: formatierter String
     """
+    # mpf.__format__ kennt in mpmath 1.3 keine Formatangaben: über float/complex
     if isinstance(val, mp.mpf):
-        return f"{val:.{digits}g}"
-    else:
-        real_str = f"{val.real:.{digits}g}"
-        imag_str = f"{abs(val.imag):.{digits}g}"
-        sign = "+" if val.imag >= 0 else "-"
-        return f"{real_str} {sign} {imag_str}j"
+        return f"{float(val):.{digits}g}"
+    val = complex(val)
+    # Vorzeichen per "+"-Format statt Verzweigung; + 0.0 macht aus -0.0 eine 0.0
+    imag_str = f"{val.imag + 0.0:+.{digits}g}"
+    return f"{val.real:.{digits}g} {imag_str[0]} {imag_str[1:]}j"
+
+
+@lru_cache(maxsize=1024)
+def _parse_s(text: str) -> Any:
+    """Wertet eine Stelle wie '2' oder '0.5+14.1347j' aus (gecacht je String)."""
+    return ast.literal_eval(text)
 
 
 def main() -> None:
@@ -71,7 +396,7 @@ def main() -> None:
     args = parser.parse_args()
 
     try:
-        s_val = ast.literal_eval(args.s)
+        s_val = _parse_s(args.s)
         result = zeta(s_val, precision=args.prec, verbose=args.verbose)
         if args.raw:
             print(result)
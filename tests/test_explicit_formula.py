@@ -0,0 +1,93 @@
+import numpy as np
+import mpmath as mp
+import pytest
+
+import explicit_formula
+from explicit_formula import precompute_mp_zeros, riemann_psi, riemann_psi_batch
+
+# Künstliche "Nullstellen" auf der kritischen Geraden: beide Auswertungen
+# rechnen dieselbe Formel, für den Vergleich genügen beliebige ρ
+ZEROS = [complex(0.5, t) for t in np.linspace(14.0, 600.0, 300)]
+
+
+@pytest.mark.parametrize(
+    "x_values",
+    [
+        [10.0 * 2**k for k in range(12)],  # geometrisch
+        [round(1e5 * 1.5**k) for k in range(8)],  # fast geometrisch
+        [17.0, 250.0, 1e3, 3.3e4, 1e5, 7.7e5],  # nicht geometrisch
+    ],
+)
+def test_riemann_psi_batch_matches_scalar(x_values):
+    with mp.workdps(15):
+        expected = [riemann_psi(x, ZEROS) for x in x_values]
+    np.testing.assert_allclose(
+        riemann_psi_batch(x_values, ZEROS), expected, rtol=0, atol=1e-6
+    )
+
+
+def _psi_reference(x, zeros, dps=40):
+    """ψ(x) über die schlichte mpmath-Schleife."""
+    with mp.workdps(dps):
+        x_mp = mp.mpf(x)
+        total = mp.fsum(
+            mp.power(x_mp, mp.mpc(rho.real, rho.imag)) / mp.mpc(rho.real, rho.imag)
+            for rho in zeros
+        )
+        return float((x_mp - total - mp.log(2 * mp.pi)).real)
+
+
+BACKEND_ZEROS = ZEROS[:60]
+BACKEND_X = [50.0, 1234.5, 1e5]
+
+
+@pytest.mark.parametrize("have_numba", [False, True])
+def test_riemann_psi_double_backends(monkeypatch, have_numba):
+    if have_numba and not explicit_formula.HAVE_NUMBA:
+        pytest.skip("numba nicht installiert")
+    monkeypatch.setattr(explicit_formula, "HAVE_NUMBA", have_numba)
+    with mp.workdps(15):
+        for x in BACKEND_X:
+            expected = _psi_reference(x, BACKEND_ZEROS)
+            assert riemann_psi(x, BACKEND_ZEROS) == pytest.approx(expected, abs=1e-9)
+
+
+@pytest.mark.parametrize("have_flint", [False, True])
+def test_riemann_psi_multiprecision_backends(monkeypatch, have_flint):
+    if have_flint and not explicit_formula.HAVE_FLINT:
+        pytest.skip("python-flint nicht installiert")
+    monkeypatch.setattr(explicit_formula, "HAVE_FLINT", have_flint)
+    with mp.workdps(30):
+        for x in BACKEND_X:
+            expected = _psi_reference(x, BACKEND_ZEROS)
+            assert riemann_psi(x, BACKEND_ZEROS) == pytest.approx(expected, abs=1e-9)
+
+
+def test_riemann_psi_precomputed_takes_mpmath_path(monkeypatch):
+    def no_flint(*args):
+        raise AssertionError("precomputed muss den mpmath-Pfad wählen")
+
+    monkeypatch.setattr(explicit_formula, "HAVE_FLINT", True)
+    monkeypatch.setattr(explicit_formula, "_zero_sum_flint", no_flint)
+    with mp.workdps(30):
+        precomputed = precompute_mp_zeros(BACKEND_ZEROS)
+        value = riemann_psi(1234.5, BACKEND_ZEROS, precomputed=precomputed)
+    assert value == pytest.approx(_psi_reference(1234.5, BACKEND_ZEROS), abs=1e-9)
+
+
+def test_riemann_psi_parallel_mpmath(monkeypatch):
+    monkeypatch.setattr(explicit_formula, "HAVE_FLINT", False)
+    monkeypatch.setattr(explicit_formula, "_PARALLEL_MIN_WORK", 0)
+    monkeypatch.setattr(explicit_formula.os, "cpu_count", lambda: 2)
+    try:
+        executors = []
+        for x in BACKEND_X:
+            with mp.workdps(30):
+                value = riemann_psi(x, BACKEND_ZEROS)
+            assert value == pytest.approx(_psi_reference(x, BACKEND_ZEROS), abs=1e-9)
+            executors.append(explicit_formula._EXECUTOR)
+        # Ein Pool für alle Aufrufe statt eines neuen pro riemann_psi
+        assert executors[0] is not None
+        assert all(executor is executors[0] for executor in executors)
+    finally:
+        explicit_formula._shutdown_executor()
@@ -35,6 +35,28 @@ class TestOdlyzkoBasics:
         assert isinstance(theta, float)
         assert not np.isnan(theta) and not np.isinf(theta)
 
+    def test_core_sum_double_matches_high_precision(self):
+        fast = OdlyzkoSchönhage(OdlyzkoConfig(T_start=100.0, T_end=105.0))
+        exact = OdlyzkoSchönhage(
+            OdlyzkoConfig(T_start=100.0, T_end=105.0, high_precision=True)
+        )
+        assert abs(fast.core_sum_F(102.5) - exact.core_sum_F(102.5)) < 1e-12
+
+    def test_fft_grid_matches_direct_sum(self):
+        config = OdlyzkoConfig(T_start=10000.0, T_end=10002.0)
+        algo = OdlyzkoSchönhage(config)
+        grid = algo._grid_fft()
+        for j in (0, 5, config.R // 2, config.R - 1):
+            t = config.T_start + j * config.delta
+            assert abs(grid[j] - algo.core_sum_F(t)) < 1e-9
+
+    def test_Z_batch_matches_scalar(self):
+        algo = OdlyzkoSchönhage(OdlyzkoConfig(T_start=100.0, T_end=110.0))
+        ts = np.linspace(100.0, 110.0, 17)
+        batch = algo.compute_Z_batch(ts)
+        scalar = [algo.compute_Z_function(t) for t in ts]
+        assert np.allclose(batch, scalar, atol=1e-10)
+
 
 class TestOdlyzkoVsReference:
     """Vergleichstests gegen bekannte Referenzwerte"""
@@ -64,6 +86,16 @@ class TestFFTHelpers:
         expected = np.sin(np.pi / 2)
         assert abs(interpolated - expected) < 0.1
 
+    def test_batch_interpolate_matches_scalar(self):
+        t_vals = np.linspace(0, 2 * np.pi, 32)
+        interpolator = FFTInterpolator(
+            np.sin(t_vals), delta=2 * np.pi / 32, t_start=0
+        )
+        ts = np.linspace(0, 6, 50)
+        batch = interpolator.batch_interpolate(ts)
+        scalar = [interpolator.interpolate(t) for t in ts]
+        assert np.allclose(batch, scalar)
+
 
 class TestPerformance:
     @pytest.mark.slow
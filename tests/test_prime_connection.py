@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import prime_connection
+from prime_connection import _simple_sieve, generate_primes
+
+_SEGMENT_SPAN = 30 * prime_connection._SEGMENT_BYTES
+
+
+def _reference_primes(n):
+    """Unsegmentiertes Eratosthenes-Sieb als Referenz."""
+    if n < 2:
+        return []
+    is_prime = np.ones(n + 1, dtype=bool)
+    is_prime[:2] = False
+    for p in range(2, int(n**0.5) + 1):
+        if is_prime[p]:
+            is_prime[p * p :: p] = False
+    return np.flatnonzero(is_prime).tolist()
+
+
+@pytest.fixture(params=[False, True], ids=["numpy", "numba"])
+def sieve_backend(request, monkeypatch):
+    if request.param and not prime_connection.HAVE_NUMBA:
+        pytest.skip("numba nicht installiert")
+    monkeypatch.setattr(prime_connection, "HAVE_NUMBA", request.param)
+    # Mehrere Segmente auch auf einem Kern über den Thread-Pool verteilen
+    monkeypatch.setattr(prime_connection, "_SIEVE_WORKERS", 2)
+    _simple_sieve.cache_clear()
+    generate_primes.cache_clear()
+    yield request.param
+    _simple_sieve.cache_clear()
+    generate_primes.cache_clear()
+
+
+def test_small_n(sieve_backend):
+    for n in range(200):
+        expected = _reference_primes(n)
+        assert generate_primes(n) == expected
+        assert list(_simple_sieve(n)) == expected
+
+
+@pytest.mark.parametrize("k", [-31, -30, -29, -1, 0, 1, 29, 30, 31])
+def test_segment_edges(sieve_backend, k):
+    n = _SEGMENT_SPAN + k
+    assert generate_primes(n) == _reference_primes(n)
+
+
+@pytest.mark.parametrize("n", [2 * 10**6, 5 * 10**6])
+def test_multiple_segments(sieve_backend, n):
+    assert generate_primes(n) == _reference_primes(n)
@@ -1,8 +1,10 @@
+import numpy as np
 import pytest
 from riemann_siegel import (
     zeta_riemann_siegel,
     riemann_siegel_z,
     find_zeros_riemann_siegel,
+    _z_on_grid,
 )
 from mpmath import mp
 
@@ -24,3 +26,20 @@ def test_siegel_z_symmetry():
 def test_find_zeros_small_interval():
     zeros = find_zeros_riemann_siegel(14, 15, step=0.1, precision=20)
     assert isinstance(zeros, list)
+
+
+def test_find_zeros_double_path_matches_mpmath_path():
+    # precision=15 nimmt den complex128-Gitterpfad, 16 den mpmath-Pfad
+    zeros_double = find_zeros_riemann_siegel(14, 60, step=0.1, precision=15)
+    zeros_mp = find_zeros_riemann_siegel(14, 60, step=0.1, precision=16)
+    assert zeros_double == zeros_mp
+    assert len(zeros_double) > 0
+
+
+def test_z_on_grid_matches_scalar():
+    # Mehr Punkte als _GRID_REANCHOR, damit fortgeschriebene Terme geprüft werden
+    step = 0.1
+    ts = [100 + step * k for k in range(300)]
+    grid = _z_on_grid(ts, step)
+    scalar = np.array([float(riemann_siegel_z(t, precision=15)) for t in ts])
+    np.testing.assert_allclose(grid, scalar, rtol=0, atol=1e-12)
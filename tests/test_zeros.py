@@ -0,0 +1,65 @@
+import pickle
+
+import mpmath as mp
+import pytest
+
+import zeros
+from zeros import find_zeros
+
+# Erste drei Nullstellen auf der kritischen Geraden
+EXPECTED = [
+    complex(0.5, 14.134725),
+    complex(0.5, 21.02204),
+    complex(0.5, 25.010858),
+]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(zeros, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(zeros, "_ZETAZEROS", {})
+    with mp.workdps(15):
+        yield tmp_path
+
+
+def _forbid_zetazero(monkeypatch):
+    def fail(job):
+        raise AssertionError(f"mp.zetazero für {job} aufgerufen")
+
+    monkeypatch.setattr(zeros, "_zetazero_one", fail)
+
+
+def test_find_zeros_cold_cache_writes_file(cache_dir):
+    roots = find_zeros(3)
+    assert all(abs(r - e) < 1e-5 for r, e in zip(roots, EXPECTED))
+    with open(zeros._zetazero_cache_file(15), "rb") as f:
+        assert len(pickle.load(f)) == 3
+
+
+def test_find_zeros_warm_cache_skips_zetazero(cache_dir, monkeypatch):
+    cold = find_zeros(3)
+    # Speicher-Cache leeren, damit die Datei gelesen werden muss
+    monkeypatch.setattr(zeros, "_ZETAZEROS", {})
+    _forbid_zetazero(monkeypatch)
+    assert find_zeros(3) == cold
+    assert find_zeros(2) == cold[:2]
+
+
+def test_find_zeros_corrupt_cache_is_recomputed(cache_dir):
+    path = zeros._zetazero_cache_file(15)
+    path.write_bytes(b"\x80\x04kein pickle")
+    roots = find_zeros(2)
+    assert all(abs(r - e) < 1e-5 for r, e in zip(roots, EXPECTED))
+    with open(path, "rb") as f:
+        assert len(pickle.load(f)) == 2
+
+
+def test_cache_dir_from_environment(monkeypatch, tmp_path):
+    import importlib
+
+    monkeypatch.setenv("RIEMANN_CACHE_DIR", str(tmp_path))
+    try:
+        assert importlib.reload(zeros)._CACHE_DIR == tmp_path
+    finally:
+        monkeypatch.delenv("RIEMANN_CACHE_DIR")
+        importlib.reload(zeros)
@@ -1,8 +1,13 @@
 import pytest
-from zeta import zeta
+from zeta import format_result, zeta, zeta_grid, zeta_many, zeta_parallel
 import mpmath as mp
 
-mp.mp.dps = 20
+
+@pytest.fixture(autouse=True, scope="module")
+def _module_precision():
+    """Eine mpmath-Präzision für das ganze Modul, danach wiederhergestellt."""
+    with mp.workdps(50):
+        yield
 
 
 def test_zeta_at_two():
@@ -16,3 +21,128 @@ def test_zeta_at_two():
 def test_zeta_zero():
     # ζ(-1) = -1/12
     assert mp.almosteq(zeta(-1), -1 / 12, 1e-12)
+
+
+def test_zeta_cache_rounds_down_higher_precision(monkeypatch):
+    import zeta as zeta_module
+
+    calls = []
+    evaluate = zeta_module._evaluate
+
+    def counting_evaluate(s, precision):
+        calls.append(precision)
+        return evaluate(s, precision)
+
+    monkeypatch.setattr(zeta_module, "_evaluate", counting_evaluate)
+    # Schwacher Cache (> 50 Stellen) und starker Cache (≤ 50 Stellen)
+    for s, high_dps, low_dps in ((0.5 + 14.5j, 60, 30), (0.5 + 15.5j, 40, 20)):
+        calls.clear()
+        high = zeta(s, precision=high_dps)
+        low = zeta(s, precision=low_dps)
+        assert calls == [high_dps]
+        with mp.workdps(low_dps):
+            expected = mp.zeta(mp.mpc(s))
+        assert mp.almosteq(low, expected, 10.0 ** (5 - low_dps))
+        assert mp.almosteq(high, low, 10.0 ** (5 - low_dps))
+
+
+@pytest.mark.parametrize("precision", [15, 30])
+def test_zeta_many_matches_zeta(precision):
+    points = [2, -3, 0.5 + 14j, 3 + 2j, -3.0, -0.5 + 5j]
+    expected = [zeta(s, precision=precision) for s in points]
+    assert zeta_many(points, precision=precision) == expected
+
+
+def test_zeta_grid_matches_zeta():
+    taus = [0.0, 14.134725, 21.0]
+    for precision in (15, 30):
+        values = zeta_grid(0.5, taus, precision=precision)
+        assert values.dtype == object
+        expected = [zeta(complex(0.5, t), precision=precision) for t in taus]
+        assert list(values) == expected
+
+
+def test_zeta_double_fast_path_matches_mpmath():
+    s = 0.5 + 100j
+    with mp.workdps(15):
+        expected = mp.zeta(mp.mpc(0.5, 100))
+    assert mp.almosteq(zeta(s, precision=15), expected, 1e-12)
+
+
+def test_format_result():
+    assert format_result(mp.mpf(2.5)) == "2.5"
+    assert format_result(mp.mpc(0.5, 14.25)) == "0.5 + 14.25j"
+    assert format_result(mp.mpc(1, -2), digits=3) == "1 - 2j"
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        mp.mpf(-1.5),
+        mp.mpc(-2.5, 3),
+        mp.mpc(-0.5, 20),
+        mp.mpc(-0.5, 5000),
+        mp.mpc(-3.25, 20000),
+    ],
+)
+def test_zeta_functional_equation_left_half_plane(s):
+    precision = 30
+    with mp.workdps(70):
+        expected = mp.zeta(s)
+    value = zeta(s, precision=precision)
+    with mp.workdps(70):
+        assert abs(value - expected) <= 10 ** (2 - precision) * abs(expected)
+
+
+@pytest.mark.parametrize("precision", [15, 20])
+def test_zeta_parallel_matches_zeta(precision, monkeypatch):
+    import zeta as zeta_module
+
+    # Den Pool auch für wenige Stellen erzwingen
+    monkeypatch.setattr(zeta_module, "_PARALLEL_MIN_WORK", 0)
+    points = [complex(0.5, t) for t in range(10, 42)] + [2, -1]
+    values = zeta_parallel(points, precision=precision, workers=2)
+    assert values == [zeta(s, precision=precision) for s in points]
+
+
+@pytest.mark.parametrize("s", [1, 1.0, 1 + 0j])
+def test_zeta_pole(s):
+    with pytest.raises(ValueError):
+        zeta(s, precision=15)
+    assert mp.isfinite(zeta(1 + 1e-12j, precision=15))
+
+
+def test_zeta_high_precision_cache_is_weak():
+    import gc
+    import zeta as zeta_module
+
+    value = zeta(0.5 + 17j, precision=80)
+    assert zeta(0.5 + 17j, precision=80) is value
+    del value
+    gc.collect()
+    key = mp.mpc(0.5, 17)._mpc_
+    assert (key, 80) not in zeta_module._ZETA_CACHE_WEAK
+    assert key not in zeta_module._ZETA_CACHE_WEAK_DPS
+
+
+def test_zeta_weak_cache_keeps_newer_precision():
+    import gc
+    import zeta as zeta_module
+
+    s = mp.mpc(0.5, 18)
+    low = zeta(s, precision=60)
+    high = zeta(s, precision=90)
+    # Stirbt der ältere Wert, bleibt der Eintrag des neueren erhalten
+    del low
+    gc.collect()
+    assert zeta_module._ZETA_CACHE_WEAK_DPS[s._mpc_] == 90
+    del high
+    gc.collect()
+    assert s._mpc_ not in zeta_module._ZETA_CACHE_WEAK_DPS
+
+
+def test_zeta_integer_closed_forms():
+    assert zeta(-2) == 0
+    assert mp.almosteq(zeta(0), -0.5, 1e-40)
+    assert mp.almosteq(zeta(4, precision=40), mp.pi**4 / 90, 1e-35)
+    assert mp.almosteq(zeta(3, precision=40), mp.apery, 1e-35)